@@ -0,0 +1,65 @@
+"""
+Count DB commits/statements per process_briefing job.
+
+Media slicing and the analyzer stages are replaced with synthetic slices so
+only progress reporting and persistence are measured. Needs Redis (REDIS_URL);
+any DATABASE_URL works, e.g.:
+
+    PYTHONPATH=services DATABASE_URL=sqlite:////tmp/bench.db python scripts/bench_db_writes.py --slices 100
+"""
+import argparse, time, uuid
+from sqlalchemy import event
+from api import tasks, models
+from api.celery_app import celery_app
+from api.config import settings
+from api.db import engine, SessionLocal
+
+
+def _fake_slices(n):
+    def slicer(path, slice_len=45, **_):
+        return [{"idx": i, "t_start": i*slice_len, "t_end": (i+1)*slice_len, "video_path": path} for i in range(n)]
+    return slicer
+
+
+def _fake_analyze(sm, uploader=None):
+    return {
+        "idx": sm["idx"], "t_start": sm["t_start"], "t_end": sm["t_end"],
+        "transcript": "we will publish the report tomorrow",
+        "metrics": {
+            "content": {"clarity": 3.1, "transparency": 3.5, "consistency": 5.0, "accountability": 2.0, "jargon_ratio": 0.0},
+            "delivery": {"tone": 2.4, "nonverbal": 2.5, "language_precision": 5.0},
+            "impact": {"trust_proj": 2.8, "media_sensitivity": 5.0, "future_proof": 5.0},
+        },
+        "risk_tags": ["risky_quote"] if sm["idx"] % 7 == 0 else [],
+        "thumbnails": [], "au": {"motion": 0.5},
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--slices", type=int, default=100)
+    args = ap.parse_args()
+
+    celery_app.conf.update(task_always_eager=True, result_backend="cache+memory://")
+    settings.result_cache = False
+    tasks.slice_video = _fake_slices(args.slices)
+    tasks._analyze_slice = _fake_analyze
+    models.Base.metadata.create_all(engine)
+
+    counts = {"commits": 0, "statements": 0}
+    def on_commit(conn): counts["commits"] += 1
+    def on_execute(conn, cursor, statement, params, context, executemany): counts["statements"] += 1
+    event.listen(engine, "commit", on_commit)
+    event.listen(engine, "before_cursor_execute", on_execute)
+
+    job_id = str(uuid.uuid4())
+    db = SessionLocal(); db.add(models.Job(id=job_id, status="PENDING", progress=0)); db.commit(); db.close()
+    counts.update(commits=0, statements=0)
+    t0 = time.perf_counter()
+    tasks.process_briefing.apply(args=[__file__, None, 45], task_id=job_id).get()
+    dt = time.perf_counter() - t0
+    print(f"slices={args.slices} commits={counts['commits']} statements={counts['statements']} wall={dt*1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+End-to-end benchmark on synthetic briefing media.
+
+Generates test videos with ffmpeg (lavfi testsrc2 + sine tone) at the requested
+lengths/resolution, uploads each to a local S3 stand-in (moto), then runs the
+real fetch_media → process_briefing path eagerly against SQLite. ASR uses Vosk
+when a model is present, otherwise a deterministic synthetic transcript (~2.5
+words/s drawn from plain words plus the scoring lexicons). Reports media-seconds
+processed per wall-second, peak RSS and the per-stage breakdown from Job.timings.
+
+Needs ffmpeg/ffprobe on PATH and `pip install -r requirements-bench.txt`.
+Redis defaults to an in-process fake; set BENCH_REDIS_URL to use a real one.
+
+    PYTHONPATH=services python scripts/bench_e2e.py --durations 60 300 --resolution 1280x720
+    PYTHONPATH=services python scripts/bench_e2e.py --json out.json --baseline main.json --tolerance 0.2
+
+Pipeline settings come from the environment as usual (SHARED_AUDIO=true etc.),
+so the same media can be compared across configurations.
+"""
+import argparse, json, os, random, resource, shutil, subprocess, sys, tempfile, time, uuid, wave, zlib
+
+WORKDIR = tempfile.mkdtemp(prefix="attacked-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{WORKDIR}/bench.db")
+os.environ.setdefault("MINIO_ACCESS_KEY", "bench")
+os.environ.setdefault("MINIO_SECRET_KEY", "bench")
+os.environ.setdefault("MINIO_BUCKET", "attacked-bench")
+
+WORDS = ("the", "team", "we", "our", "customers", "data", "incident", "report", "today", "update", "systems",
+         "restored", "working", "with", "teams", "and", "is", "was", "to", "a", "of", "in", "will", "be")
+
+
+def _local_services():
+    """Start the S3 stand-in and point Redis at a fake unless BENCH_REDIS_URL is set."""
+    from moto.server import ThreadedMotoServer
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    os.environ["MINIO_ENDPOINT"] = f"{host}:{port}"
+    if os.getenv("BENCH_REDIS_URL"):
+        os.environ["REDIS_URL"] = os.environ["BENCH_REDIS_URL"]
+    else:
+        import fakeredis, redis
+        fake = fakeredis.FakeServer()
+        redis.Redis.from_url = staticmethod(lambda *a, **k: fakeredis.FakeRedis(server=fake))
+        import redis.asyncio
+        redis.asyncio.Redis.from_url = staticmethod(lambda *a, **k: fakeredis.FakeAsyncRedis(server=fake))
+    return server
+
+
+def make_video(path: str, duration: int, resolution: str, fps: int):
+    subprocess.run([
+        "ffmpeg", "-v", "error", "-y",
+        "-f", "lavfi", "-i", f"testsrc2=size={resolution}:rate={fps}:duration={duration}",
+        "-f", "lavfi", "-i", f"sine=frequency=220:beep_factor=4:duration={duration}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p", "-c:a", "aac", "-shortest", path,
+    ], check=True)
+
+
+def _synthetic_words(seconds: float, seed: int) -> list[dict]:
+    from analyzer import lexicon
+    rnd = random.Random(seed)
+    vocab = list(WORDS) + [p for lex in ("BUZZWORDS", "HEDGES", "WEASEL", "NEXT_STEPS") for p in lexicon.LEXICONS[lex]]
+    words, t = [], 0.0
+    while t < seconds:
+        for w in rnd.choice(vocab).split():
+            words.append({"word": w, "start": round(t, 2), "end": round(t + 0.3, 2), "conf": 1.0})
+            t += 0.4
+    return words
+
+
+def stub_asr(tasks):
+    """Replace ASR entry points with deterministic synthetic transcripts."""
+    def _text(words):
+        return " ".join(w["word"] for w in words), words
+
+    def transcribe(wav_path):
+        with wave.open(wav_path) as wf:
+            seconds = wf.getnframes() / wf.getframerate()
+        return _text(_synthetic_words(seconds, seed=zlib.crc32(os.path.basename(wav_path).encode())))
+
+    def transcribe_pcm(pcm, sr=16000):
+        return _text(_synthetic_words(len(pcm) / sr, seed=len(pcm)))
+
+    def transcribe_stream(pcm, sr=16000):
+        return _synthetic_words(len(pcm) / sr, seed=len(pcm))
+
+    tasks.asr_transcribe, tasks.asr_transcribe_pcm, tasks.transcribe_stream = transcribe, transcribe_pcm, transcribe_stream
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux; children covers the ffmpeg subprocesses
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(max(self_rss, child_rss) / 1024, 1)
+
+
+def run_job(tasks, models, storage, SessionLocal, video: str, slice_len: int) -> dict:
+    job_id = str(uuid.uuid4())
+    key = f"uploads/{job_id}/{os.path.basename(video)}"
+    with open(video, "rb") as f:
+        storage.put_fileobj(key, f, "video/mp4")
+    db = SessionLocal(); db.add(models.Job(id=job_id, status="PENDING", progress=0)); db.commit(); db.close()
+
+    t0 = time.perf_counter()
+    tasks.fetch_media.apply(args=[job_id], kwargs={"object_key": key, "filename": os.path.basename(video),
+                                                   "slice_len": slice_len}).get()
+    wall = time.perf_counter() - t0
+
+    db = SessionLocal()
+    job = db.get(models.Job, job_id)
+    out = {"status": job.status, "error": job.error, "wall_s": round(wall, 3), "timings": job.timings}
+    db.close()
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--durations", type=int, nargs="+", default=[60, 180], help="video lengths in seconds")
+    ap.add_argument("--resolution", default="640x360")
+    ap.add_argument("--fps", type=int, default=25)
+    ap.add_argument("--slice-len", type=int, default=15)
+    ap.add_argument("--json", help="write results here")
+    ap.add_argument("--baseline", help="earlier --json output; exit 1 if throughput regressed")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="allowed throughput drop vs baseline")
+    ap.add_argument("--keep", action="store_true", help="keep the work dir (videos, db)")
+    ap.add_argument("--no-warmup", action="store_true", help="skip the unreported warm-up job (imports, JIT)")
+    args = ap.parse_args()
+
+    server = _local_services()
+    from api.celery_app import celery_app
+    celery_app.conf.update(task_always_eager=True, task_eager_propagates=True,
+                           result_backend="cache+memory://", broker_url="memory://")
+    from api import tasks, models, storage
+    from api.config import settings
+    from api.db import engine, SessionLocal
+    from analyzer.asr import preload
+    models.Base.metadata.create_all(engine)
+    storage.s3.create_bucket(Bucket=storage.BUCKET)
+    settings.result_cache = False  # every run must do the work
+    asr = "vosk" if preload() else "synthetic"
+    if asr == "synthetic":
+        stub_asr(tasks)
+
+    results = []
+    try:
+        if not args.no_warmup:
+            warm = os.path.join(WORKDIR, "warmup.mp4")
+            make_video(warm, 2 * args.slice_len, args.resolution, args.fps)
+            run_job(tasks, models, storage, SessionLocal, warm, args.slice_len)
+        for duration in args.durations:
+            video = os.path.join(WORKDIR, f"synthetic_{duration}s_{args.resolution}.mp4")
+            make_video(video, duration, args.resolution, args.fps)
+            r = run_job(tasks, models, storage, SessionLocal, video, args.slice_len)
+            if r["status"] != "SUCCESS":
+                sys.exit(f"job failed for {duration}s video: {r['error']}")
+            r.update(duration_s=duration, resolution=args.resolution, throughput=round(duration / r["wall_s"], 2),
+                     peak_rss_mb=peak_rss_mb(), asr=asr)
+            results.append(r)
+            stages = r["timings"]["stages"]
+            print(f"{duration:>5}s {args.resolution:>9}  wall={r['wall_s']:7.2f}s  "
+                  f"throughput={r['throughput']:6.2f} media-s/s  peak_rss={r['peak_rss_mb']}MB  asr={asr}")
+            for name, s in sorted(stages.items(), key=lambda kv: -kv[1]["total_s"]):
+                print(f"        {name:<20} {s['total_s']:8.3f}s  n={s['count']:<4} max={s['max_s']:.3f}s")
+    finally:
+        server.stop()
+        if not args.keep:
+            shutil.rmtree(WORKDIR, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            base = {(b["duration_s"], b["resolution"]): b["throughput"] for b in json.load(f)}
+        regressed = [r for r in results if (r["duration_s"], r["resolution"]) in base
+                     and r["throughput"] < base[(r["duration_s"], r["resolution"])] * (1 - args.tolerance)]
+        for r in regressed:
+            print(f"REGRESSION {r['duration_s']}s {r['resolution']}: {r['throughput']:.2f} media-s/s "
+                  f"vs baseline {base[(r['duration_s'], r['resolution'])]:.2f}")
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Micro-benchmark: old vs new GET /v1/briefings/{id}/slices serialization path.
+
+old: ORM objects → list of dicts → FastAPI jsonable_encoder → json (JSONResponse)
+new: Core tuples → orjson (what get_slices builds on a response-cache miss)
+
+Cache hits skip both. Uses a throwaway SQLite database by default:
+
+    PYTHONPATH=services python scripts/bench_json.py --sizes 10 100 1000
+"""
+import argparse, os, time, uuid
+os.environ.setdefault("DATABASE_URL", "sqlite:////tmp/bench_json.db")
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import select
+from api import models
+from api.db import engine, SessionLocal
+
+
+def _seed(n: int) -> str:
+    bid = str(uuid.uuid4())
+    metrics = {
+        "content": {"clarity": 3.1, "transparency": 3.5, "consistency": 5.0, "accountability": 2.0, "jargon_ratio": 0.01},
+        "delivery": {"tone": 2.4, "nonverbal": 2.5, "language_precision": 5.0, "wpm": 151.2},
+        "impact": {"trust_proj": 2.8, "media_sensitivity": 5.0, "future_proof": 5.0},
+    }
+    db = SessionLocal()
+    db.add(models.Briefing(id=bid, video_src="bench", duration_s=n*45, slice_len_s=45, scores={}, highlights=[], volatility={}))
+    db.flush()
+    db.execute(models.Slice.__table__.insert(), [{
+        "id": str(uuid.uuid4()), "briefing_id": bid, "t_start": i*45, "t_end": (i+1)*45,
+        "transcript": "we will publish the full incident report tomorrow " * 12,
+        "metrics": metrics, "risk_tags": ["risky_quote"], "thumbnails": [f"/tmp/attacked/sl_{i:02d}.jpg"],
+        "au": {"motion": 0.42},
+    } for i in range(n)])
+    db.commit(); db.close()
+    return bid
+
+
+def old_path(bid: str) -> bytes:
+    db = SessionLocal()
+    rows = db.query(models.Slice).filter(models.Slice.briefing_id==bid).order_by(models.Slice.t_start).all()
+    out = [{"slice_id": s.id, "t_start": s.t_start, "t_end": s.t_end, "transcript": s.transcript,
+            "metrics": s.metrics, "risk_tags": s.risk_tags, "thumbnails": s.thumbnails, "au": s.au} for s in rows]
+    body = JSONResponse(jsonable_encoder(out)).body
+    db.close()
+    return body
+
+
+def new_path(bid: str) -> bytes:
+    S = models.Slice
+    cols = ("slice_id", "t_start", "t_end", "transcript", "metrics", "risk_tags", "thumbnails", "au")
+    db = SessionLocal()
+    rows = db.execute(select(S.id, S.t_start, S.t_end, S.transcript, S.metrics, S.risk_tags, S.thumbnails, S.au)
+                      .where(S.briefing_id == bid).order_by(S.t_start)).all()
+    body = orjson.dumps([dict(zip(cols, r)) for r in rows])
+    db.close()
+    return body
+
+
+def _time(fn, bid, repeat):
+    fn(bid)  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(bid)
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+    models.Base.metadata.create_all(engine)
+    for n in args.sizes:
+        bid = _seed(n)
+        assert orjson.loads(old_path(bid)) == orjson.loads(new_path(bid))
+        old, new = _time(old_path, bid, args.repeat), _time(new_path, bid, args.repeat)
+        print(f"slices={n:<5} old={old:8.2f}ms new={new:8.2f}ms speedup={old/new:4.1f}x bytes={len(new_path(bid))}")
+
+
+if __name__ == "__main__":
+    main()
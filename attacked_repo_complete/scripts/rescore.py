@@ -0,0 +1,34 @@
+"""
+Re-score stored transcripts after a lexicon/weight change, without touching media.
+
+Enqueue across workers (one task per briefing-id range):
+
+    PYTHONPATH=services python scripts/rescore.py --shards 16
+
+Or run in-process against DATABASE_URL:
+
+    PYTHONPATH=services python scripts/rescore.py --inline
+
+Briefings already at the current scoring version are skipped, so re-running
+after an interruption only processes what is left.
+"""
+import argparse
+from api import tasks
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--shards", type=int, default=16)
+    ap.add_argument("--chunk", type=int, default=1000, help="slices per write transaction")
+    ap.add_argument("--inline", action="store_true", help="run here instead of enqueuing")
+    args = ap.parse_args()
+
+    if args.inline:
+        for lo, hi in tasks._id_ranges(args.shards):
+            print(tasks.rescore_range.run(lo, hi, args.chunk))
+    else:
+        print(tasks.rescore.delay(args.shards, args.chunk).id)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,4 @@
 # Makes this a package
+
+# Bump when scoring logic changes in a way lexicon/weight fingerprints don't capture
+ANALYZER_VERSION = "1.1.0"
@@ -1,45 +1,85 @@
+import heapq, math
 import numpy as np
 
 CONTENT_W=0.4; DELIVERY_W=0.3; IMPACT_W=0.3
 
-def _layer_avg(results, layer):
-    vals = []
-    for r in results:
-        m = r["metrics"][layer]
-        # average sub-metrics
-        sub = [v for k,v in m.items() if isinstance(v,(int,float))]
-        vals.append(float(np.mean(sub)))
-    return float(np.mean(vals)) if vals else 0.0, float(np.std(vals)) if vals else 0.0
+LAYERS = ("content", "delivery", "impact")
+
+def _slice_mean(m: dict) -> float:
+    # average sub-metrics
+    sub = [v for k,v in m.items() if isinstance(v,(int,float))]
+    return float(np.mean(sub))
+
+
+class Welford:
+    """Running mean / population variance (matches np.mean / np.std)."""
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.n, self.mean, self.m2 = n, mean, m2
+
+    def add(self, x: float):
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self.m2 += d * (x - self.mean)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / self.n) if self.n else 0.0
+
+
+class BriefingAggregator:
+    """
+    Incremental aggregate_briefing: feed slice results as they complete and
+    snapshot() at any time. Memory is O(layers + top_k), not O(slices).
+    Highlights match aggregate_briefing: most risk tags first, earliest slice on ties.
+    """
+    def __init__(self, top_k: int = 3):
+        self.top_k = top_k
+        self.layers = {layer: Welford() for layer in LAYERS}
+        self.duration_s = 0
+        self._heap = []  # min-heap of (n_tags, -seq, highlight)
+        self._seq = 0
+
+    def add(self, r: dict):
+        for layer, acc in self.layers.items():
+            acc.add(_slice_mean(r["metrics"][layer]))
+        self.duration_s = max(self.duration_s, r["t_end"])
+        tags = r["risk_tags"]
+        item = (len(tags), -self._seq, {
+            "t_start": r["t_start"], "t_end": r["t_end"],
+            "risk_tags": tags,
+            "note": ", ".join(tags) or ""
+        })
+        self._seq += 1
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+
+    def extend(self, results):
+        for r in results:
+            self.add(r)
+        return self
+
+    def snapshot(self) -> dict:
+        avg = {layer: acc.mean for layer, acc in self.layers.items()}
+        composite = CONTENT_W*avg["content"] + DELIVERY_W*avg["delivery"] + IMPACT_W*avg["impact"]
+        ranked = sorted(self._heap, key=lambda it: it[:2], reverse=True)
+        return {
+            "duration_s": self.duration_s,
+            "slices": self._seq,
+            "scores": {
+                "content": round(avg["content"],2),
+                "delivery": round(avg["delivery"],2),
+                "impact": round(avg["impact"],2),
+                "composite": round(composite,2),
+            },
+            "highlights": [h for _n, _s, h in ranked],
+            "volatility": {layer: round(acc.std,2) for layer, acc in self.layers.items()},
+        }
+
 
 def aggregate_briefing(results, slice_len_s: int):
-    # Compute layer averages
-    content_avg, content_std = _layer_avg(results, "content")
-    delivery_avg, delivery_std = _layer_avg(results, "delivery")
-    impact_avg, impact_std = _layer_avg(results, "impact")
-    composite = CONTENT_W*content_avg + DELIVERY_W*delivery_avg + IMPACT_W*impact_avg
-
-    # Duration & highlights
-    duration_s = results[-1]["t_end"] if results else 0
-    # naive top-3 risky windows by count of risk tags
-    ranked = sorted(results, key=lambda r: len(r["risk_tags"]), reverse=True)[:3]
-    highlights = [{
-        "t_start": r["t_start"], "t_end": r["t_end"],
-        "risk_tags": r["risk_tags"],
-        "note": ", ".join(r["risk_tags"]) or ""
-    } for r in ranked]
-
-    return {
-        "duration_s": duration_s,
-        "scores": {
-            "content": round(content_avg,2),
-            "delivery": round(delivery_avg,2),
-            "impact": round(impact_avg,2),
-            "composite": round(composite,2),
-        },
-        "highlights": highlights,
-        "volatility": {
-            "content": round(content_std,2),
-            "delivery": round(delivery_std,2),
-            "impact": round(impact_std,2),
-        },
-    }
+    return BriefingAggregator().extend(results).snapshot()
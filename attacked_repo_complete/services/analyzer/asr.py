@@ -1,7 +1,11 @@
 from vosk import Model, KaldiRecognizer
-import json, wave, os
+from contextlib import contextmanager
+import json, wave, os, threading
 
 _model = None
+# Idle recognizers per sample rate, reused across slices/jobs in this process
+_pool: dict[int, list] = {}
+_pool_lock = threading.Lock()
 
 def _load_model():
     global _model
@@ -12,16 +16,37 @@ def _load_model():
         _model = Model(model_path)
     return _model
 
-def transcribe(wav_path: str):
+def preload() -> bool:
+    """
+    Load the model (and warm one recognizer) up front, e.g. on worker boot.
+    Returns False instead of raising when no model is installed.
+    """
+    try:
+        with _recognizer(16000):
+            pass
+        return True
+    except RuntimeError:
+        return False
+
+@contextmanager
+def _recognizer(sr: int):
     model = _load_model()
-    wf = wave.open(wav_path, "rb")
-    rec = KaldiRecognizer(model, wf.getframerate())
-    rec.SetWords(True)
+    with _pool_lock:
+        idle = _pool.setdefault(sr, [])
+        rec = idle.pop() if idle else None
+    if rec is None:
+        rec = KaldiRecognizer(model, sr)
+        rec.SetWords(True)
+    try:
+        yield rec
+    finally:
+        rec.Reset()
+        with _pool_lock:
+            _pool[sr].append(rec)
+
+def _recognize(rec, chunks):
     text_words = []
-    while True:
-        data = wf.readframes(4000)
-        if len(data) == 0:
-            break
+    for data in chunks:
         if rec.AcceptWaveform(data):
             res = json.loads(rec.Result())
             text_words.extend(res.get("result", []))
@@ -29,3 +54,43 @@ def transcribe(wav_path: str):
     text_words.extend(final.get("result", []))
     transcript = " ".join([w.get("word","") for w in text_words])
     return transcript.strip(), text_words
+
+def _pcm_chunks(pcm, step: int = 4000 * 2):
+    buf = memoryview(pcm).cast("B")  # no copy of the whole buffer
+    return (bytes(buf[i:i+step]) for i in range(0, len(buf), step))
+
+def transcribe(wav_path: str):
+    wf = wave.open(wav_path, "rb")
+    with _recognizer(wf.getframerate()) as rec:
+        return _recognize(rec, iter(lambda: wf.readframes(4000), b""))
+
+def transcribe_pcm(pcm, sr: int = 16000):
+    """
+    Transcribe an in-memory int16 mono buffer (e.g. a view from media_prep.slice_pcm)
+    """
+    with _recognizer(sr) as rec:
+        return _recognize(rec, _pcm_chunks(pcm))
+
+def transcribe_stream(pcm, sr: int = 16000) -> list[dict]:
+    """
+    Feed a whole file's int16 buffer through one recognizer. Word start/end
+    times are relative to the start of the buffer, so words spanning a slice
+    boundary survive and can be bucketed with bucket_words.
+    """
+    with _recognizer(sr) as rec:
+        return _recognize(rec, _pcm_chunks(pcm))[1]
+
+def bucket_words(words: list[dict], slices: list[dict]) -> list[list[dict]]:
+    """
+    Assign each word to the slice whose [t_start, t_end) contains its start time
+    """
+    buckets = [[] for _ in slices]
+    if not slices:
+        return buckets
+    i = 0
+    for w in sorted(words, key=lambda w: w.get("start", 0.0)):
+        t = w.get("start", 0.0)
+        while i < len(slices) - 1 and t >= slices[i]["t_end"]:
+            i += 1
+        buckets[i].append(w)
+    return buckets
@@ -1,19 +1,35 @@
-import re
-from .utils import norm01, to_0_5
+import numpy as np
+from .utils import to_0_5
+from . import lexicon
 
-RISK_PHRASES = [r"\bunder investigation\b", r"\bno comment\b", r"\bclassified\b"]
+RISK_PHRASES = sorted(lexicon.LEXICONS["RISK_PHRASES"])
 
 def detect_media_risks(text: str):
-    t = text.lower()
+    hits = lexicon.scan(text)
     tags = []
-    for pat in RISK_PHRASES:
-        if re.search(pat, t): tags.append("media_sensitive")
-    if re.search(r"\bquote\b", t): tags.append("risky_quote")
-    return list(set(tags))
+    if "RISK_PHRASES" in hits: tags.append("media_sensitive")
+    if "QUOTE" in hits: tags.append("risky_quote")
+    return tags
 
 def score_impact(text: str, content: dict, delivery: dict) -> dict:
+    hits = lexicon.scan(text)
     trust = to_0_5(0.5*content["clarity"] / 5.0 + 0.5*delivery["tone"] / 5.0)
     media = to_0_5(1.0 - 0.5*len(detect_media_risks(text)))
-    next_steps = 1.0 if re.search(r"\b(we will|by \w+day|on \d{4}-\d{2}-\d{2}|tomorrow|next week)\b", text, re.I) else 0.0
-    future = to_0_5(0.6*next_steps + 0.4*(1 - (1 if "tbd" in text.lower() else 0)))
+    next_steps = 1.0 if "NEXT_STEPS" in hits else 0.0
+    future = to_0_5(0.6*next_steps + 0.4*(1 - (1 if "TBD" in hits else 0)))
     return {"trust_proj": round(trust, 2), "media_sensitivity": round(media, 2), "future_proof": round(future, 2)}
+
+def score_impact_batch(texts: list[str], contents: list[dict], deliveries: list[dict]) -> list[dict]:
+    """score_impact over many transcripts with their content/delivery dicts; identical output."""
+    if not texts:
+        return []
+    hits = [lexicon.scan(t) for t in texts]
+    has = lambda name: np.array([name in h for h in hits], dtype=float)
+    clarity = np.array([c["clarity"] for c in contents], dtype=float)
+    tone = np.array([d["tone"] for d in deliveries], dtype=float)
+    n_media = has("RISK_PHRASES") + has("QUOTE")
+    trust = np.clip(5.0 * (0.5*clarity / 5.0 + 0.5*tone / 5.0), 0.0, 5.0)
+    media = np.clip(5.0 * (1.0 - 0.5*n_media), 0.0, 5.0)
+    future = np.clip(5.0 * (0.6*has("NEXT_STEPS") + 0.4*(1 - has("TBD"))), 0.0, 5.0)
+    return [{"trust_proj": round(float(trust[i]), 2), "media_sensitivity": round(float(media[i]), 2),
+             "future_proof": round(float(future[i]), 2)} for i in range(len(texts))]
@@ -0,0 +1,129 @@
+import os, re
+from collections import Counter
+from functools import lru_cache
+from .utils import BUZZWORDS, HEDGES, WEASEL, RISKY_QUOTES
+
+# Token-level Aho-Corasick-style phrase matcher: every lexicon phrase is tokenized the
+# same way as transcripts and stored in one trie, so a scan costs
+# O(tokens x longest phrase) no matter how many phrases the lexicons hold.
+TOKEN_RE = re.compile(r"\b[\w'-]+\b")
+
+# Built-in lexicons the scorers read; configs/default.yml `lexicons:` extends them
+LEXICONS = {
+    "BUZZWORDS": BUZZWORDS,
+    "HEDGES": HEDGES,
+    "WEASEL": WEASEL,
+    "RISKY_QUOTES": RISKY_QUOTES,
+    "RISK_PHRASES": {"under investigation", "no comment", "classified"},
+    "VENDOR_BLAME": {"blame vendor", "vendor fault", "third party", "third-party"},
+    "VENDOR": {"vendor", "vendors", "third party", "third-party"},
+    "WEASEL_TAG": {"weasel words", "sort of", "kind of"},
+    "ACK": {f"{who} {verb} {full}responsibility" for who in ("i", "we")
+            for verb in ("take", "accept") for full in ("", "full ")},
+    "NEGATION": {"is not", "are not", "will not"},
+    "NEXT_STEPS": {"we will", "tomorrow", "next week"},
+    "TBD": {"tbd"},
+    "QUOTE": {"quote"},
+}
+
+# The few entries that are genuinely patterns, not phrases; run as one combined regex
+PATTERNS = {
+    "NEXT_STEPS": [r"\bby \w+day\b", r"\bon \d{4}-\d{2}-\d{2}\b"],
+}
+
+_END = ""  # trie key marking "a phrase ends here"; never a real token
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.replace("’", "'").lower())
+
+
+class Hits:
+    """Result of one scan: per-lexicon match counts plus the transcript word count."""
+    __slots__ = ("counts", "n_words")
+
+    def __init__(self, counts: Counter, n_words: int):
+        self.counts = counts
+        self.n_words = n_words
+
+    def __getitem__(self, name: str) -> int:
+        return self.counts.get(name, 0)
+
+    def __contains__(self, name: str) -> bool:
+        return self.counts.get(name, 0) > 0
+
+
+class LexiconEngine:
+    def __init__(self, lexicons: dict, patterns: dict | None = None):
+        self.trie: dict = {}
+        self.depth = 0
+        for name, phrases in lexicons.items():
+            for phrase in phrases:
+                toks = tokenize(phrase)
+                if not toks:
+                    continue
+                node = self.trie
+                for tok in toks:
+                    node = node.setdefault(tok, {})
+                node.setdefault(_END, set()).add(name)
+                self.depth = max(self.depth, len(toks))
+        groups, self.group_names = [], {}
+        for name, pats in (patterns or {}).items():
+            for i, pat in enumerate(pats):
+                g = f"g{len(groups)}"
+                groups.append(f"(?P<{g}>{pat})")
+                self.group_names[g] = name
+        self.pattern = re.compile("|".join(groups), re.I) if groups else None
+
+    def scan_tokens(self, toks: list[str]) -> Counter:
+        counts = Counter()
+        trie, n = self.trie, len(toks)
+        for i in range(n):
+            node = trie.get(toks[i])
+            j = i + 1
+            while node is not None:
+                ends = node.get(_END)
+                if ends:
+                    counts.update(ends)
+                if j >= n:
+                    break
+                node = node.get(toks[j])
+                j += 1
+        return counts
+
+    def scan(self, text: str) -> Hits:
+        toks = tokenize(text)
+        counts = self.scan_tokens(toks)
+        if self.pattern is not None:
+            for m in self.pattern.finditer(text):
+                counts[self.group_names[m.lastgroup]] += 1
+        return Hits(counts, len(toks))
+
+
+def load_config_lexicons(path: str | None = None) -> dict:
+    path = path or os.getenv("CONFIG_PATH", "configs/default.yml")
+    try:
+        import yaml
+        with open(path) as f:
+            cfg = yaml.safe_load(f) or {}
+    except (ImportError, OSError):
+        return {}
+    return {k: set(v or ()) for k, v in (cfg.get("lexicons") or {}).items()}
+
+
+def merged_lexicons() -> dict:
+    lex = {k: set(v) for k, v in LEXICONS.items()}
+    for name, phrases in load_config_lexicons().items():
+        lex.setdefault(name, set()).update(phrases)
+    return lex
+
+
+@lru_cache(maxsize=1)
+def engine() -> LexiconEngine:
+    return LexiconEngine(merged_lexicons(), PATTERNS)
+
+
+@lru_cache(maxsize=256)
+def scan(text: str) -> Hits:
+    # Memoized so content, risk and impact scoring of one transcript share a single pass
+    return engine().scan(text)
@@ -1,31 +1,143 @@
-import os, subprocess, math
+import os, subprocess, math, wave
+import numpy as np
 from typing import List, Dict
 
 SLICE_LEN_DEFAULT=45
+AUDIO_SR=16000
+WORK_DIR="/tmp/attacked"  # default scratch dir; the pipeline passes a per-job directory
 
 def ff(cmd: list[str]):
     subprocess.run(cmd, check=True)
 
-def slice_video(video_path: str, slice_len: int = SLICE_LEN_DEFAULT) -> List[Dict]:
-    # Probe duration
+def probe_duration(video_path: str) -> float:
     probe = subprocess.run(["ffprobe","-v","error","-show_entries","format=duration","-of","default=noprint_wrappers=1:nokey=1", video_path], capture_output=True, text=True, check=True)
-    duration = float(probe.stdout.strip())
-    out = []
-    t=0.0; i=0
+    return float(probe.stdout.strip())
+
+def _slice_bounds(duration: float, slice_len: int) -> List[tuple]:
+    bounds = []
+    t=0.0
     while t < duration:
         end = min(duration, t + slice_len)
-        tmp_vid = f"/tmp/attacked/sl_{i:02d}.mp4"
+        bounds.append((t, end))
+        t=end
+    return bounds
+
+def slice_video(video_path: str, slice_len: int = SLICE_LEN_DEFAULT, work_dir: str = WORK_DIR) -> List[Dict]:
+    # Probe duration
+    duration = probe_duration(video_path)
+    out = []
+    for i, (t, end) in enumerate(_slice_bounds(duration, slice_len)):
+        tmp_vid = os.path.join(work_dir, f"sl_{i:02d}.mp4")
         ff(["ffmpeg","-y","-ss", str(t), "-to", str(end), "-i", video_path, "-c","copy", tmp_vid])
         out.append({"idx": i, "t_start": int(t), "t_end": int(end), "video_path": tmp_vid})
-        i+=1; t=end
     return out
 
-def prepare_slice(slice_obj: Dict):
+def has_audio(video_path: str) -> bool:
+    probe = subprocess.run(["ffprobe","-v","error","-select_streams","a:0","-show_entries","stream=index","-of","csv=p=0", video_path], capture_output=True, text=True, check=True)
+    return bool(probe.stdout.strip())
+
+def keyframe_times(video_path: str) -> List[float]:
+    """Presentation times of the first video stream's keyframes (packet scan, no decode)."""
+    probe = subprocess.run(["ffprobe","-v","error","-select_streams","v:0","-show_entries","packet=pts_time,flags","-of","compact=p=0", video_path], capture_output=True, text=True, check=True)
+    times = []
+    for line in probe.stdout.splitlines():
+        f = dict(kv.split("=", 1) for kv in line.split("|") if "=" in kv)
+        if "K" in f.get("flags", "") and f.get("pts_time", "N/A") != "N/A":
+            times.append(float(f["pts_time"]))
+    return sorted(times)
+
+def _keyframe_cuts(keyframes: List[float], duration: float, slice_len: int) -> List[float]:
+    """Slice starts after 0: the first keyframe at or after each multiple of slice_len (where a stream copy can cut)."""
+    cuts = []
+    for k in range(1, math.ceil(duration / slice_len)):
+        t = next((kf for kf in keyframes if kf >= k * slice_len), None)
+        if t is None or t >= duration:
+            break
+        if not cuts or t > cuts[-1]:
+            cuts.append(t)
+    return cuts
+
+def _write_silence(path: str, seconds: float, sr: int = AUDIO_SR):
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1); w.setsampwidth(2); w.setframerate(sr)
+        w.writeframes(b"\0\0" * int(seconds * sr))
+
+def segment_video(video_path: str, slice_len: int = SLICE_LEN_DEFAULT, work_dir: str = WORK_DIR,
+                  audio_dir: str | None = None) -> List[Dict]:
+    """
+    Single-pass alternative to slice_video + prepare_slice: one ffmpeg run
+    demuxes the source once and writes slice videos (stream copy), 16 kHz
+    mono WAV segments (into `audio_dir` if given) and one thumbnail per slice
+    via the segment muxer. Returns the same slice metadata, with
+    wav_path/thumbnails pre-filled so prepare_slice becomes a no-op.
+
+    A stream copy can only cut at keyframes, so slices start at the first
+    keyframe at or after each multiple of `slice_len` and every output is
+    cut at those same times; slices are therefore only roughly `slice_len`
+    long. Sources without audio get silent WAVs.
+    """
+    audio_dir = audio_dir or work_dir
+    duration = probe_duration(video_path)
+    cuts = _keyframe_cuts(keyframe_times(video_path), duration, slice_len)
+    starts, ends = [0.0] + cuts, cuts + [duration]
+    # One segment when there is nothing to cut at (the muxer's default would be 2 s)
+    seg = ["-segment_times", ",".join(f"{c:.6f}" for c in cuts)] if cuts else ["-segment_time", str(math.ceil(duration) + 1)]
+    audio = has_audio(video_path)
+    cmd = ["ffmpeg","-y","-i", video_path,
+           # slice videos: copy, cut at the keyframes chosen above
+           "-map","0:v:0","-map","0:a:0?","-c","copy","-f","segment", *seg,
+           "-reset_timestamps","1", os.path.join(work_dir, "sl_%02d.mp4")]
+    if audio:
+        # slice audio: 16 kHz mono PCM cut at the same times
+        cmd += ["-map","0:a:0","-ac","1","-ar","16000","-c:a","pcm_s16le","-f","segment", *seg,
+                os.path.join(audio_dir, "sl_%02d.wav")]
+    # thumbnails: first frame at or after each slice start
+    select = "+".join(["isnan(prev_selected_t)"] + [f"gte(t,{c:.6f})*lt(prev_selected_t,{c:.6f})" for c in cuts])
+    cmd += ["-map","0:v:0","-vf", f"select='{select}'", "-fps_mode","vfr","-start_number","0",
+            os.path.join(work_dir, "sl_%02d_000.jpg")]
+    ff(cmd)
+    out = []
+    for i, (t, end) in enumerate(zip(starts, ends)):
+        vid, wav = os.path.join(work_dir, f"sl_{i:02d}.mp4"), os.path.join(audio_dir, f"sl_{i:02d}.wav")
+        if not audio:
+            _write_silence(wav, end - t)
+        missing = [p for p in (vid, wav) if not os.path.exists(p)]
+        if missing:
+            raise RuntimeError(f"segment_video: ffmpeg did not write {', '.join(missing)}")
+        thumb = os.path.join(work_dir, f"sl_{i:02d}_000.jpg")
+        out.append({"idx": i, "t_start": round(t, 3), "t_end": round(end, 3), "video_path": vid, "wav_path": wav,
+                    "thumbnails": [thumb] if os.path.exists(thumb) else []})
+    return out
+
+def decode_audio(video_path: str, pcm_path: str, sr: int = AUDIO_SR) -> str:
+    """
+    Decode the whole audio track once to raw 16-bit mono PCM at `sr`.
+    Slices are then read as zero-copy views via load_pcm/slice_pcm.
+    """
+    ff(["ffmpeg","-y","-i", video_path, "-vn", "-ac", "1", "-ar", str(sr), "-f", "s16le", "-c:a", "pcm_s16le", pcm_path])
+    return pcm_path
+
+def load_pcm(pcm_path: str) -> np.ndarray:
+    # Memory-mapped so concurrent slice tasks share the page cache instead of copying
+    if os.path.getsize(pcm_path) == 0:
+        return np.zeros(0, dtype=np.int16)
+    return np.memmap(pcm_path, dtype=np.int16, mode="r")
+
+def slice_pcm(pcm: np.ndarray, t_start: float, t_end: float, sr: int = AUDIO_SR) -> np.ndarray:
+    return pcm[int(t_start*sr):int(t_end*sr)]
+
+def prepare_slice(slice_obj: Dict, audio: bool = True, audio_dir: str | None = None):
+    """WAV (into `audio_dir`, default next to the slice video) + first-frame thumbnail."""
+    if "wav_path" in slice_obj:
+        # Already produced by segment_video
+        return slice_obj["wav_path"], slice_obj.get("thumbnails", [])
     vid = slice_obj["video_path"]
-    base = os.path.splitext(os.path.basename(vid))[0]
-    wav = f"/tmp/attacked/{base}.wav"
-    ff(["ffmpeg","-y","-i", vid, "-ac", "1", "-ar", "16000", wav])
+    stem = os.path.splitext(vid)[0]
+    wav = None
+    if audio:
+        wav = os.path.join(audio_dir, os.path.basename(stem) + ".wav") if audio_dir else stem + ".wav"
+        ff(["ffmpeg","-y","-i", vid, "-ac", "1", "-ar", "16000", wav])
     # Thumbnails (first frame)
-    thumb = f"/tmp/attacked/{base}_000.jpg"
+    thumb = f"{stem}_000.jpg"
     ff(["ffmpeg","-y","-i", vid, "-frames:v","1", thumb])
     return wav, [thumb]
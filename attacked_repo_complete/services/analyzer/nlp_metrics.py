@@ -1,13 +1,15 @@
 import re, statistics
-from .utils import BUZZWORDS, HEDGES, WEASEL, RISKY_QUOTES, norm01, to_0_5, syllables
+import numpy as np
+from functools import lru_cache
+from .utils import norm01, to_0_5, syllables
+from . import lexicon
 
 SENT_SPLIT = re.compile(r"(?<=[.!?]) +")
 WORD_RE = re.compile(r"\b[\w'-]+\b")
 
 def jargon_ratio(words: list[str]) -> float:
-    total = len(words) or 1
-    buzz = sum(1 for w in words if w.lower() in BUZZWORDS)
-    return buzz / total
+    hits = lexicon.scan(" ".join(words))
+    return hits["BUZZWORDS"] / (hits.n_words or 1)
 
 def fkgl(text: str) -> float:
     # Flesch-Kincaid Grade (approx)
@@ -21,36 +23,37 @@ def fkgl(text: str) -> float:
     return norm01(16 - max(5.0, min(16.0, grade)), 0, 11)
 
 def hedge_ratio(words: list[str]) -> float:
-    total = len(words) or 1
-    hed = sum(1 for w in words if w.lower() in HEDGES)
-    return hed / total
+    # Phrase-level, so multi-word hedges ("we believe") count too
+    hits = lexicon.scan(" ".join(words))
+    return hits["HEDGES"] / (hits.n_words or 1)
 
 def detect_risks(text: str) -> list[str]:
+    hits = lexicon.scan(text)
     tags = []
-    t = text.lower()
-    if any(p in t for p in ("blame vendor","vendor fault","third party")):
+    if "VENDOR_BLAME" in hits:
         tags.append("vendor_blame")
-    if any(w in t for w in ("weasel words","sort of","kind of")):
+    if "WEASEL_TAG" in hits:
         tags.append("weasel_words")
-    if any(q in t for q in (q for q in RISKY_QUOTES)):
+    if "RISKY_QUOTES" in hits:
         tags.append("risky_quote")
-    return list(set(tags))
+    return tags
 
 def score_content(text: str) -> dict:
-    words = WORD_RE.findall(text)
-    jr = jargon_ratio(words)
-    hr = hedge_ratio(words)
+    hits = lexicon.scan(text)
+    n = hits.n_words or 1
+    jr = hits["BUZZWORDS"] / n
+    hr = hits["HEDGES"] / n
     # Clarity: inverse of hedging + readability
     clarity = to_0_5(0.7*(1-hr) + 0.3*fkgl(text))
     # Transparency: fewer weasel terms + presence of acknowledgments
-    ack = 1.0 if re.search(r"\b(i|we) (take|accept) (full )?responsibility\b", text, re.I) else 0.0
-    weasel = 1.0 if any(w in text.lower() for w in WEASEL) else 0.0
+    ack = 1.0 if "ACK" in hits else 0.0
+    weasel = 1.0 if "WEASEL" in hits else 0.0
     transparency = to_0_5(0.7*(1-weasel) + 0.3*ack)
     # Consistency: penalize contradictions (naive negation flip detection within slice)
-    contradictions = len(re.findall(r"\b(is|are|will) not\b", text, re.I))
+    contradictions = hits["NEGATION"]
     consistency = to_0_5(1.0 - norm01(contradictions, 0, 3))
     # Accountability: reward responsibility statements, penalize vendor-blame
-    blame_vendor = 1 if re.search(r"vendor|third[- ]party", text, re.I) else 0
+    blame_vendor = 1 if "VENDOR" in hits else 0
     accountability = to_0_5(0.6*ack + 0.4*(1 - blame_vendor))
     return {
         "clarity": round(clarity, 2),
@@ -59,3 +62,51 @@ def score_content(text: str) -> dict:
         "accountability": round(accountability, 2),
         "jargon_ratio": round(jr, 3),
     }
+
+# --- batch API: same metrics as fkgl/score_content, vectorized over many transcripts ---
+
+@lru_cache(maxsize=65536)
+def _syl(word: str) -> int:
+    return syllables(word)
+
+def _ratio01(x, lo, hi):
+    return np.clip((x - lo) / (hi - lo), 0.0, 1.0)
+
+def _to_0_5(x):
+    return np.clip(5.0 * x, 0.0, 5.0)
+
+def fkgl_batch(texts: list[str]) -> np.ndarray:
+    n_words = np.empty(len(texts)); n_sents = np.empty(len(texts)); n_syls = np.empty(len(texts))
+    for i, text in enumerate(texts):
+        words = WORD_RE.findall(text)
+        n_words[i] = len(words)
+        n_sents[i] = sum(1 for s in SENT_SPLIT.split(text) if s.strip())
+        n_syls[i] = sum(_syl(w.lower()) for w in words) or 1
+    L = n_words / np.maximum(1, n_sents)
+    S = n_syls / np.maximum(1, n_words)
+    grade = 0.39*L + 11.8*S - 15.59
+    return _ratio01(16 - np.clip(grade, 5.0, 16.0), 0, 11)
+
+def score_content_batch(texts: list[str]) -> list[dict]:
+    """score_content over many transcripts (e.g. a briefing's slices); identical output."""
+    if not texts:
+        return []
+    hits = [lexicon.scan(t) for t in texts]
+    n = np.array([h.n_words or 1 for h in hits], dtype=float)
+    count = lambda name: np.array([h[name] for h in hits], dtype=float)
+    has = lambda name: (count(name) > 0).astype(float)
+    jr = count("BUZZWORDS") / n
+    hr = count("HEDGES") / n
+    ack, weasel, blame_vendor = has("ACK"), has("WEASEL"), has("VENDOR")
+    clarity = _to_0_5(0.7*(1-hr) + 0.3*fkgl_batch(texts))
+    transparency = _to_0_5(0.7*(1-weasel) + 0.3*ack)
+    consistency = _to_0_5(1.0 - _ratio01(count("NEGATION"), 0, 3))
+    accountability = _to_0_5(0.6*ack + 0.4*(1 - blame_vendor))
+    # Python round() per value keeps results bit-identical to score_content
+    return [{
+        "clarity": round(float(clarity[i]), 2),
+        "transparency": round(float(transparency[i]), 2),
+        "consistency": round(float(consistency[i]), 2),
+        "accountability": round(float(accountability[i]), 2),
+        "jargon_ratio": round(float(jr[i]), 3),
+    } for i in range(len(texts))]
@@ -1,15 +1,21 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi import Depends
-from fastapi.responses import JSONResponse
+from fastapi import Depends, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import select, or_, tuple_, type_coerce, cast, String, func, literal_column
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from .db import SessionLocal
+from .db import SessionLocal, async_session
 from . import models
-from .schemas import JobStatus, BriefingOut, SliceOut
-from .tasks import process_briefing
+from .schemas import JobStatus, BriefingOut, SliceOut, SearchHit, SearchResults
+from .celery_app import celery_app
 from .config import settings
+from . import progress, response_cache, storage
 from datetime import datetime
-import os, shutil, uuid, httpx
+import base64, json, logging, os, re, uuid
+import orjson
 
+logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/v1")
 
 def get_db():
@@ -19,6 +25,16 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    # Read routes run on the event loop against the async engine, not in the threadpool
+    async with async_session() as db:
+        yield db
+
+def _source_name(filename: str | None) -> str:
+    """Object/file name for an upload: "source" plus the client's extension, reduced to [a-z0-9]."""
+    ext = re.sub(r"[^a-z0-9]", "", os.path.splitext(os.path.basename(filename or ""))[1].lower())[:8]
+    return f"source.{ext}" if ext else "source"
+
 @router.post("/jobs")
 def create_job(video_url: str | None = None, file: UploadFile | None = File(default=None), db: Session = Depends(get_db)):
     if not video_url and not file:
@@ -27,72 +43,338 @@ def create_job(video_url: str | None = None, file: UploadFile | None = File(defa
     job = models.Job(id=job_id, status="PENDING", progress=0)
     db.add(job); db.commit()
 
-    # Persist local temp and schedule task
-    os.makedirs("/tmp/attacked", exist_ok=True)
+    # Uploads stream to MinIO (multipart); remote URLs are fetched by the worker.
+    # Dispatch by name: the API never imports api.tasks (and with it the analyzer stack)
     slice_len = 45
-    if file:
-        local_path = f"/tmp/attacked/{job_id}_{file.filename}"
-        with open(local_path, "wb") as f:
-            shutil.copyfileobj(file.file, f)
-        key = f"uploads/{job_id}/{file.filename}"
-    else:
-        local_path = f"/tmp/attacked/{job_id}.mp4"
-        with httpx.stream("GET", video_url, follow_redirects=True, timeout=60) as r:
-            r.raise_for_status()
-            with open(local_path, "wb") as f:
-                for chunk in r.iter_bytes():
-                    f.write(chunk)
-        key = f"uploads/{job_id}/remote.mp4"
-
-    # Enqueue
-    process_briefing.apply_async(args=[local_path, key, slice_len], task_id=job_id)
+    try:
+        if file:
+            # Never the client's filename: it may carry "/", ".." or control characters
+            name = _source_name(file.filename)
+            key = f"uploads/{job_id}/{name}"
+            storage.put_fileobj(key, file.file, file.content_type)
+            celery_app.send_task("api.tasks.fetch_media", kwargs={"job_id": job_id, "object_key": key,
+                                 "filename": name, "slice_len": slice_len}, task_id=f"{job_id}-fetch")
+        else:
+            celery_app.send_task("api.tasks.fetch_media", kwargs={"job_id": job_id, "video_url": video_url,
+                                 "slice_len": slice_len}, task_id=f"{job_id}-fetch")
+    except Exception as e:
+        # MinIO or the broker is down: fail the job instead of leaving it PENDING forever
+        logger.error(f"Could not start job {job_id}: {e}")
+        job.status = "FAILURE"
+        job.error = f"Could not start job: {e}"[:512]
+        db.commit()
+        raise HTTPException(503, detail="Storage or queue unavailable; try again later")
     return {"job_id": job_id}
 
+async def _job_status(job: models.Job) -> JobStatus:
+    done, total, live = await progress.get_live(job.id)
+    pct = job.progress
+    if job.status not in ("SUCCESS", "FAILURE"):
+        # Live progress is in Redis; the row is only flushed periodically
+        pct = max(pct, live or 0)
+    return JobStatus(job_id=job.id, status=job.status, progress=pct, error=job.error, briefing_id=job.briefing_id,
+                     bytes_downloaded=done, bytes_total=total, timings=job.timings)
+
 @router.get("/jobs/{job_id}")
-def job_status(job_id: str, db: Session = Depends(get_db)):
-    job = db.get(models.Job, job_id)
+async def job_status(job_id: str, db: AsyncSession = Depends(get_async_db)):
+    job = await db.get(models.Job, job_id)
     if not job:
         raise HTTPException(404, detail="job not found")
-    return JobStatus(job_id=job.id, status=job.status, progress=job.progress, error=job.error, briefing_id=job.briefing_id)
+    return await _job_status(job)
+
+async def _job_snapshot(job_id: str) -> tuple[JobStatus | None, list[dict]]:
+    # Own short-lived session: the stream outlives any request-scoped dependency
+    async with async_session() as db:
+        job = await db.get(models.Job, job_id)
+    return (await _job_status(job), await progress.get_slices(job_id)) if job else (None, [])
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.get("/jobs/{job_id}/events")
+async def job_events(job_id: str, request: Request):
+    """
+    Server-Sent Events stream for one job, replacing status polling. Sends a
+    `status` snapshot and any already-finished `slice`s, then relays `download`,
+    `progress`, `slice` (with the partial aggregate when available) and a final
+    `done` / `failed` event from the job's Redis channel. Slices may be repeated
+    around the replay boundary; clients de-duplicate by `idx`.
+    """
+    pubsub = progress.subscribe()
+    await pubsub.subscribe(progress.channel(job_id))  # before the snapshot, so nothing falls in between
+    status, slices = await _job_snapshot(job_id)
+    if status is None:
+        await pubsub.aclose()
+        raise HTTPException(404, detail="job not found")
+
+    async def stream():
+        try:
+            yield _sse("status", status.model_dump())
+            if status.status in ("SUCCESS", "FAILURE"):
+                return
+            for s in slices:
+                yield _sse("slice", s)
+            while not await request.is_disconnected():
+                msg = await pubsub.get_message(ignore_subscribe_messages=True, timeout=settings.sse_keepalive_s)
+                if msg is None:
+                    yield ": keepalive\n\n"
+                    continue
+                ev = json.loads(msg["data"])
+                yield _sse(ev["event"], ev["data"])
+                if ev["event"] in progress.TERMINAL_EVENTS:
+                    return
+        finally:
+            await pubsub.aclose()
+
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+def _like_escape(text: str) -> str:
+    """Literal text for a LIKE pattern used with escape="\\" (no user-supplied wildcards)."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _encode_cursor(created_at: datetime, briefing_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{briefing_id}".encode()).decode()
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        ts, bid = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(ts), bid
+    except Exception:
+        raise HTTPException(400, detail="invalid cursor")
 
 @router.get("/briefings")
-def list_briefings(db: Session = Depends(get_db)):
-    q = db.query(models.Briefing).order_by(models.Briefing.created_at.desc()).limit(50)
+async def list_briefings(
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    risk_tag: list[str] = Query(default=[]),
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    search: str | None = Query(None, max_length=200),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Newest first, keyset-paginated on (created_at, id). When more rows exist the
+    next page's cursor is returned in the X-Next-Cursor header. `search` is a
+    case-insensitive substring match on the briefing id or video source.
+    """
+    B = models.Briefing
+    # Projection: never load highlights/volatility/slices for the list view
+    q = select(B.id, B.video_src, B.scores, B.created_at).order_by(B.created_at.desc(), B.id.desc())
+    if cursor:
+        ts, bid = _decode_cursor(cursor)
+        q = q.where(tuple_(B.created_at, B.id) < tuple_(ts, bid))
+    if min_score is not None:
+        q = q.where(B.composite >= min_score)
+    if max_score is not None:
+        q = q.where(B.composite <= max_score)
+    if created_from:
+        q = q.where(B.created_at >= created_from)
+    if created_to:
+        q = q.where(B.created_at <= created_to)
+    if search:
+        pattern = f"%{_like_escape(search)}%"
+        q = q.where(or_(B.id.ilike(pattern, escape="\\"), B.video_src.ilike(pattern, escape="\\")))
+    if risk_tag:
+        if db.bind.dialect.name == "postgresql":
+            q = q.where(type_coerce(B.risk_tags, JSONB).contains(risk_tag))  # GIN-backed @>
+        else:
+            for tag in risk_tag:
+                q = q.where(cast(B.risk_tags, String).like(f'%"{_like_escape(tag)}"%', escape="\\"))
+    rows = (await db.execute(q.limit(limit + 1))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = _encode_cursor(rows[-1].created_at, rows[-1].id)
     return [
         {
-            "id": b.id,
-            "video_src": b.video_src,
-            "scores": b.scores,
-            "created_at": b.created_at.isoformat()+"Z",
-        } for b in q.all()
+            "id": r.id,
+            "video_src": r.video_src,
+            "scores": r.scores,
+            "created_at": r.created_at.isoformat()+"Z",
+        } for r in rows
     ]
 
-@router.get("/briefings/{briefing_id}")
-def get_briefing(briefing_id: str, db: Session = Depends(get_db)):
+BRIEFING_FIELDS = ("id", "video_src", "duration_s", "slice_len_s", "scores", "highlights", "volatility", "created_at",
+                   "source_url")
+SLICE_FIELDS = ("slice_id", "t_start", "t_end", "transcript", "metrics", "risk_tags", "thumbnails", "au", "audio_url")
+# Fields whose stored MinIO keys are returned as presigned URLs
+_PRESIGNED = {"source_url", "thumbnails", "audio_url"}
+
+def _projected(model, description: str, many: bool = False) -> dict:
+    """OpenAPI 200 entry for a ?fields= projection of `model`: the same keys, none of them required."""
+    schema = {k: v for k, v in model.model_json_schema().items() if k != "required"}
+    return {200: {"description": description,
+                  "content": {"application/json": {"schema": {"type": "array", "items": schema} if many else schema}}}}
+
+def _presign_ttl(fields: tuple[str, ...]) -> int | None:
+    # Cached bodies with presigned URLs are rebuilt well before the URLs expire
+    return max(1, settings.presign_ttl_s // 2) if _PRESIGNED.intersection(fields) else None
+
+def _parse_fields(fields: str | None, allowed: tuple[str, ...]) -> tuple[str, ...]:
+    """?fields=a,b → the requested subset of `allowed`, in canonical order."""
+    if not fields:
+        return allowed
+    wanted = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = wanted - set(allowed)
+    if unknown:
+        raise HTTPException(400, detail=f"unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(f for f in allowed if f in wanted)
+
+def _variant(kind: str, fields: tuple[str, ...], allowed: tuple[str, ...]) -> str:
+    return kind if fields == allowed else f"{kind}?{','.join(fields)}"
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """If-None-Match: `*` or any listed tag, compared weakly (W/ ignored)."""
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Accept-Encoding allows gzip: listed (or matched by `*`) with q > 0."""
+    qs = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [p.strip() for p in item.split(";")]
+        if not coding:
+            continue
+        q = 1.0
+        for p in params:
+            name, _, value = p.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qs[coding.lower()] = q
+    q = qs.get("gzip", qs.get("x-gzip", qs.get("*", 0.0)))
+    return q > 0
+
+def _cached_response(entry: response_cache.Entry, request: Request) -> Response:
+    gz = len(entry.body) >= settings.gzip_min_bytes and _accepts_gzip(request.headers.get("accept-encoding", ""))
+    # Each encoding is its own representation with its own ETag
+    etag = entry.etag[:-1] + '-gzip"' if gz else entry.etag
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}  # clients revalidate
+    if _etag_matches(etag, request.headers.get("if-none-match", "")):
+        return Response(status_code=304, headers=headers)
+    if gz:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=entry.gz, media_type="application/json", headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+@router.get("/briefings/{briefing_id}", responses=_projected(BriefingOut, "The briefing; only the `?fields=` keys when given"))
+async def get_briefing(briefing_id: str, request: Request, fields: str | None = None,
+                       db: AsyncSession = Depends(get_async_db)):
+    """
+    Serialized straight from a Core row with orjson (no ORM objects or model
+    re-validation). `?fields=scores,highlights` returns only those keys.
+    """
+    cols = _parse_fields(fields, BRIEFING_FIELDS)
+    B = models.Briefing
+    async def build():
+        row = (await db.execute(select(*(B.source_key if c == "source_url" else getattr(B, c) for c in cols))
+                                .where(B.id == briefing_id))).first()
+        if row is None:
+            return None
+        out = dict(zip(cols, row))
+        if "created_at" in out:
+            out["created_at"] = out["created_at"].isoformat() + "Z"
+        if "source_url" in out:
+            out["source_url"] = storage.artifact_url(out["source_url"])
+        return orjson.dumps(out)
+    entry = await response_cache.get_or_build(_variant("briefing", cols, BRIEFING_FIELDS), briefing_id, build,
+                                        ttl=_presign_ttl(cols))
+    if entry is None:
+        raise HTTPException(404, detail="not found")
+    return _cached_response(entry, request)
+
+@router.get("/briefings/{briefing_id}/slices",
+            responses=_projected(SliceOut, "Slices in time order; only the `?fields=` keys when given", many=True))
+async def get_slices(briefing_id: str, request: Request, fields: str | None = None,
+                     db: AsyncSession = Depends(get_async_db)):
+    """
+    Slice rows fetched as Core tuples (only the selected `?fields=`) and
+    serialized with orjson. Thumbnails and slice audio come back as presigned
+    MinIO URLs.
+    """
+    cols = _parse_fields(fields, SLICE_FIELDS)
+    S = models.Slice
+    column = {"slice_id": S.id, "audio_url": S.audio_key}
+    async def build():
+        rows = (await db.execute(
+            select(*(column.get(c) or getattr(S, c) for c in cols))
+            .where(S.briefing_id == briefing_id).order_by(S.t_start)
+        )).all()
+        if not rows and not await db.get(models.Briefing, briefing_id):
+            return None
+        out = [dict(zip(cols, r)) for r in rows]
+        for d in out:
+            if "thumbnails" in d:
+                d["thumbnails"] = [storage.artifact_url(t) for t in d["thumbnails"] or []]
+            if "audio_url" in d:
+                d["audio_url"] = storage.artifact_url(d["audio_url"])
+        return orjson.dumps(out)
+    entry = await response_cache.get_or_build(_variant("slices", cols, SLICE_FIELDS), briefing_id, build,
+                                        ttl=_presign_ttl(cols))
+    if entry is None:
+        # Unknown briefing: keep the old empty-list response, just don't cache it
+        return []
+    return _cached_response(entry, request)
+
+@router.delete("/briefings/{briefing_id}", status_code=204)
+def delete_briefing(briefing_id: str, db: Session = Depends(get_db)):
     b = db.get(models.Briefing, briefing_id)
     if not b:
         raise HTTPException(404, detail="not found")
-    return BriefingOut(
-        id=b.id, video_src=b.video_src, duration_s=b.duration_s, slice_len_s=b.slice_len_s,
-        scores=b.scores, highlights=b.highlights, volatility=b.volatility,
-        created_at=b.created_at.isoformat()+"Z",
-    )
-
-@router.get("/briefings/{briefing_id}/slices")
-def get_slices(briefing_id: str, db: Session = Depends(get_db)):
-    rows = db.query(models.Slice).filter(models.Slice.briefing_id==briefing_id).order_by(models.Slice.t_start).all()
-    return [
-        {
-            "slice_id": s.id,
-            "t_start": s.t_start,
-            "t_end": s.t_end,
-            "transcript": s.transcript,
-            "metrics": s.metrics,
-            "risk_tags": s.risk_tags,
-            "thumbnails": s.thumbnails,
-            "au": s.au,
-        } for s in rows
+    db.delete(b)  # slices cascade
+    db.commit()
+    response_cache.invalidate([briefing_id])
+    return Response(status_code=204)
+
+def _like_snippet(text: str, q: str, width: int = 60) -> str:
+    i = text.lower().find(q.lower())
+    if i < 0:
+        return text[:2*width]
+    a, b = max(0, i - width), min(len(text), i + len(q) + width)
+    return text[a:i] + "<mark>" + text[i:i+len(q)] + "</mark>" + text[i+len(q):b]
+
+@router.get("/search", response_model=SearchResults)
+async def search_transcripts(
+    q: str = Query(..., min_length=2),
+    briefing_id: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Ranked transcript search across slices (optionally within one briefing).
+    Postgres uses the GIN-indexed tsvector with web-search syntax and
+    ts_headline snippets; other databases fall back to a substring match.
+    """
+    S = models.Slice
+    if db.bind.dialect.name == "postgresql":
+        tsq = func.websearch_to_tsquery(literal_column("'english'"), q)
+        vec = models.transcript_tsvector()
+        rank = func.ts_rank(vec, tsq).label("rank")
+        snippet = func.ts_headline(literal_column("'english'"), S.transcript, tsq,
+                                   "StartSel=<mark>, StopSel=</mark>, MaxFragments=2").label("snippet")
+        stmt = select(S.id, S.briefing_id, S.t_start, S.t_end, rank, snippet).where(vec.op("@@")(tsq)) \
+            .order_by(rank.desc(), S.id)
+    else:
+        stmt = select(S.id, S.briefing_id, S.t_start, S.t_end, S.transcript) \
+            .where(S.transcript.ilike(f"%{_like_escape(q)}%", escape="\\")).order_by(S.briefing_id, S.t_start)
+    if briefing_id:
+        stmt = stmt.where(S.briefing_id == briefing_id)
+    rows = (await db.execute(stmt.limit(limit + 1).offset(offset))).all()
+    more = len(rows) > limit
+    hits = [
+        SearchHit(
+            briefing_id=r.briefing_id, slice_id=r.id, t_start=r.t_start, t_end=r.t_end,
+            rank=float(getattr(r, "rank", 0.0) or 0.0),
+            snippet=r.snippet if hasattr(r, "snippet") else _like_snippet(r.transcript or "", q),
+        ) for r in rows[:limit]
     ]
+    return SearchResults(hits=hits, next_offset=offset + limit if more else None)
 
 @router.get("/health")
 def health():
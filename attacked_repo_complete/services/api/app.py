@@ -1,8 +1,10 @@
-from fastapi import FastAPI
+import time
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from .api_routes import router
-from .db import engine
+from .db import async_engine, backfill_briefings, engine, sync_schema
+from . import metrics
 from .models import Base
 from .config import settings
 
@@ -13,12 +15,36 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
+metrics.instrument_engine(engine, "api")
+
+@app.middleware("http")
+async def observe_latency(request: Request, call_next):
+    t0 = time.perf_counter()
+    response = await call_next(request)
+    # Route template (e.g. /v1/briefings/{briefing_id}) keeps label cardinality bounded
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    metrics.HTTP_SECONDS.labels(request.method, route, response.status_code).observe(time.perf_counter() - t0)
+    return response
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    body, content_type = metrics.render()
+    return Response(body, media_type=content_type)
+
 # Create tables on startup (simple dev approach)
 @app.on_event("startup")
 async def startup():
     Base.metadata.create_all(bind=engine)
+    sync_schema(Base.metadata)
+    backfill_briefings()  # list filters skip rows with NULL composite/risk_tags
+    metrics.instrument_engine(async_engine().sync_engine, "api")
+
+@app.on_event("shutdown")
+async def shutdown():
+    await async_engine().dispose()
 
 app.include_router(router)
 
@@ -0,0 +1,92 @@
+import hashlib, json
+import redis
+from .config import settings
+
+# Content-addressed result cache (Redis). Keys combine a media/audio hash with a
+# fingerprint of everything that affects scores, so a lexicon/weight/config change
+# naturally misses instead of serving stale results.
+_redis = redis.Redis.from_url(settings.redis_url)
+_TTL = settings.result_ttl_days * 86400
+
+
+class HashingWriter:
+    """
+    File wrapper that hashes bytes as they are written (uploads/downloads)
+    """
+    def __init__(self, f):
+        self.f = f
+        self.h = hashlib.sha256()
+
+    def write(self, data: bytes):
+        self.h.update(data)
+        return self.f.write(data)
+
+    def hexdigest(self) -> str:
+        return self.h.hexdigest()
+
+
+def hash_buffer(buf) -> str:
+    return hashlib.sha256(memoryview(buf).cast("B")).hexdigest()
+
+
+def hash_file(path: str, chunk: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def scoring_version() -> str:
+    """
+    Fingerprint of the text scoring inputs (analyzer version, lexicons, weights).
+    Stored on each Briefing; the rescore task refreshes briefings that differ.
+    """
+    # Worker-side only: pulls in the analyzer lexicons and weights
+    from analyzer import ANALYZER_VERSION
+    from analyzer import aggregation, lexicon
+    parts = {
+        "version": ANALYZER_VERSION,
+        "lexicons": {k: sorted(v) for k, v in lexicon.merged_lexicons().items()},
+        "patterns": lexicon.PATTERNS,
+        "weights": [aggregation.CONTENT_W, aggregation.DELIVERY_W, aggregation.IMPACT_W],
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def fingerprint(slice_len: int) -> str:
+    parts = {
+        "scoring": scoring_version(),
+        "slice_len": slice_len,
+        "pipeline": [settings.streaming_asr, settings.motion_sample_fps, settings.motion_max_side,
+                     settings.single_pass_segmenter, settings.shared_audio],
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def get_briefing_id(media_hash: str, fp: str) -> str | None:
+    v = _redis.get(f"attacked:cache:briefing:{media_hash}:{fp}")
+    return v.decode() if v else None
+
+
+def set_briefing_id(media_hash: str, fp: str, briefing_id: str):
+    _redis.set(f"attacked:cache:briefing:{media_hash}:{fp}", briefing_id, ex=_TTL)
+
+
+def get_slice(audio_hash: str, fp: str) -> dict | None:
+    v = _redis.get(f"attacked:cache:slice:{audio_hash}:{fp}")
+    return json.loads(v) if v else None
+
+
+def set_slice(audio_hash: str, fp: str, result: dict):
+    _redis.set(f"attacked:cache:slice:{audio_hash}:{fp}", json.dumps(result), ex=_TTL)
+
+
+def get_features(audio_hash: str, version: str) -> dict | None:
+    """Delivery frame features by slice audio hash; `version` is the extractor's FEATURES_VERSION."""
+    v = _redis.get(f"attacked:cache:feat:{version}:{audio_hash}")
+    return json.loads(v) if v else None
+
+
+def set_features(audio_hash: str, version: str, features: dict):
+    _redis.set(f"attacked:cache:feat:{version}:{audio_hash}", json.dumps(features), ex=_TTL)
@@ -1,8 +1,21 @@
-import os
+import os, time
 from celery import Celery
+from celery.signals import before_task_publish
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
 
+# Native thread pools per worker process. librosa/NumPy (BLAS) and OpenCV each
+# default to one thread per core, which oversubscribes CPUs under prefork; the
+# env vars must be set before those libraries load (OpenCV is capped in tasks).
+NATIVE_THREADS = os.getenv("WORKER_NATIVE_THREADS", "1")
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS", "NUMBA_NUM_THREADS"):
+    os.environ.setdefault(_var, NATIVE_THREADS)
+
+# Queues: downloads (IO-bound fetches), short/long (media analysis split by
+# duration so long videos never sit in front of short clips), maintenance
+# (archive rescoring) and the default "celery" queue for bookkeeping tasks.
+SHORT_QUEUE, LONG_QUEUE = "short", "long"
+
 celery_app = Celery(
     "attacked",
     broker=REDIS_URL,
@@ -17,4 +30,23 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    # Media fetches are IO-bound: keep them off the analysis workers. fetch_media
+    # sends process_briefing to LONG_QUEUE for long media; its slices follow it.
+    task_routes={
+        "api.tasks.fetch_media": {"queue": "downloads"},
+        "api.tasks.process_briefing": {"queue": SHORT_QUEUE},
+        "api.tasks.analyze_slice": {"queue": SHORT_QUEUE},
+        "api.tasks.finalize_briefing": {"queue": SHORT_QUEUE},
+        "api.tasks.rescore*": {"queue": "maintenance"},
+    },
+    # One reserved task per process: a long job can't hold short ones hostage in a prefetch buffer
+    worker_prefetch_multiplier=int(os.getenv("WORKER_PREFETCH_MULTIPLIER", "1")),
 )
+
+
+@before_task_publish.connect
+def _stamp_sent_at(headers=None, **_):
+    # Publish time for the queue-wait histogram (observed by workers at task_prerun).
+    # Lives here, not in tasks, because the API publishes without importing tasks.
+    if headers is not None:
+        headers.setdefault("sent_at", time.time())
@@ -19,6 +19,75 @@ class Settings(BaseSettings):
     deepgram_api_key: str | None = Field(default=os.getenv("DEEPGRAM_API_KEY"))
     assemblyai_api_key: str | None = Field(default=os.getenv("ASSEMBLYAI_API_KEY"))
 
+    # Fan each slice out to its own Celery task (chord) instead of a serial loop
+    pipeline_fanout: bool = Field(default=os.getenv("PIPELINE_FANOUT", "false").lower() == "true")
+    # Demux once with ffmpeg's segment muxer (slice videos + wavs + thumbnails in one run)
+    single_pass_segmenter: bool = Field(default=os.getenv("SINGLE_PASS_SEGMENTER", "false").lower() == "true")
+    # Decode audio once to a memory-mapped PCM buffer shared by ASR and delivery scoring
+    shared_audio: bool = Field(default=os.getenv("SHARED_AUDIO", "false").lower() == "true")
+    # Transcribe the whole file with one recognizer and bucket words into slices
+    streaming_asr: bool = Field(default=os.getenv("STREAMING_ASR", "false").lower() == "true")
+    # Motion estimate sampling: adjacent frame pairs at ~N fps (0 = every frame),
+    # optional downscale cap (0 = full res) and ffmpeg-side decode/scale via a pipe
+    motion_sample_fps: float = Field(default=float(os.getenv("MOTION_SAMPLE_FPS", "0")))
+    motion_max_side: int = Field(default=int(os.getenv("MOTION_MAX_SIDE", "0")))
+    motion_ffmpeg: bool = Field(default=os.getenv("MOTION_FFMPEG", "false").lower() == "true")
+    # Content-addressed result cache (whole briefings + per-slice results)
+    result_cache: bool = Field(default=os.getenv("RESULT_CACHE", "true").lower() == "true")
+    result_ttl_days: int = Field(default=int(os.getenv("RESULT_TTL_DAYS", "14")))
+    # Job progress is published to Redis on every step; the DB row is flushed at most this often
+    progress_flush_s: float = Field(default=float(os.getenv("PROGRESS_FLUSH_S", "10")))
+    # Comment line sent on idle /jobs/{id}/events streams so proxies keep them open
+    sse_keepalive_s: float = Field(default=float(os.getenv("SSE_KEEPALIVE_S", "15")))
+    # Serialized GET /briefings/{id}[/slices] responses: per-process LRU (size-bounded)
+    # plus an optional shared Redis tier; invalidated on rescore/delete
+    response_cache: bool = Field(default=os.getenv("RESPONSE_CACHE", "true").lower() == "true")
+    response_cache_max_mb: int = Field(default=int(os.getenv("RESPONSE_CACHE_MAX_MB", "64")))
+    response_cache_redis: bool = Field(default=os.getenv("RESPONSE_CACHE_REDIS", "false").lower() == "true")
+    # Cached briefing/slice responses at least this large are served gzipped when accepted
+    gzip_min_bytes: int = Field(default=int(os.getenv("GZIP_MIN_BYTES", "1024")))
+    # Prometheus /metrics listener on Celery workers (0 = off); the API serves GET /metrics
+    worker_metrics_port: int = Field(default=int(os.getenv("WORKER_METRICS_PORT", "0")))
+    # Media longer than this goes to the "long" queue (and its dedicated workers)
+    long_media_s: float = Field(default=float(os.getenv("LONG_MEDIA_S", "600")))
+    # Hard time limits (seconds); the soft limit is 90% and fails the job cleanly
+    short_time_limit_s: int = Field(default=int(os.getenv("SHORT_TIME_LIMIT_S", "1800")))
+    long_time_limit_s: int = Field(default=int(os.getenv("LONG_TIME_LIMIT_S", "14400")))
+    slice_time_limit_s: int = Field(default=int(os.getenv("SLICE_TIME_LIMIT_S", "900")))
+    download_time_limit_s: int = Field(default=int(os.getenv("DOWNLOAD_TIME_LIMIT_S", "3600")))
+    # Artifacts (source media, thumbnails, optional slice wavs) upload to MinIO on a
+    # bounded thread pool while analysis runs; the API hands out presigned URLs
+    upload_artifacts: bool = Field(default=os.getenv("UPLOAD_ARTIFACTS", "true").lower() == "true")
+    upload_slice_audio: bool = Field(default=os.getenv("UPLOAD_SLICE_AUDIO", "false").lower() == "true")
+    upload_workers: int = Field(default=int(os.getenv("UPLOAD_WORKERS", "8")))
+    s3_max_pool_connections: int = Field(default=int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32")))
+    # Connect/read timeout per MinIO request, so a stalled transfer fails instead of hanging
+    s3_timeout_s: float = Field(default=float(os.getenv("S3_TIMEOUT_S", "60")))
+    presign_ttl_s: int = Field(default=int(os.getenv("PRESIGN_TTL_S", "3600")))
+    # Base URL browsers use to reach MinIO (defaults to http://MINIO_ENDPOINT)
+    minio_public_url: str | None = Field(default=os.getenv("MINIO_PUBLIC_URL"))
+    # Per-job scratch dirs under WORKSPACE_ROOT, removed when the job ends. Admission
+    # reserves source size x WORKSPACE_RESERVE_FACTOR against WORKSPACE_BUDGET_MB
+    # (0 = no budget) and keeps WORKSPACE_MIN_FREE_MB free; over-budget jobs wait
+    workspace_root: str = Field(default=os.getenv("WORKSPACE_ROOT", "/tmp/attacked"))
+    workspace_budget_mb: int = Field(default=int(os.getenv("WORKSPACE_BUDGET_MB", "0")))
+    workspace_min_free_mb: int = Field(default=int(os.getenv("WORKSPACE_MIN_FREE_MB", "512")))
+    workspace_reserve_factor: float = Field(default=float(os.getenv("WORKSPACE_RESERVE_FACTOR", "2.5")))
+    workspace_retry_s: int = Field(default=int(os.getenv("WORKSPACE_RETRY_S", "30")))
+    workspace_max_waits: int = Field(default=int(os.getenv("WORKSPACE_MAX_WAITS", "120")))
+    workspace_max_age_h: float = Field(default=float(os.getenv("WORKSPACE_MAX_AGE_H", "24")))
+    # RAM-backed dir (e.g. /dev/shm/attacked) for slice audio; node-local, so ignored with PIPELINE_FANOUT
+    workspace_audio_root: str | None = Field(default=os.getenv("WORKSPACE_AUDIO_ROOT") or None)
+
+    # Connection pool per engine and process (API: sync writes + async reads; each worker
+    # child: one sync engine). Size for (api processes x 2 + worker children) x (size + overflow)
+    # staying under Postgres max_connections; pre-ping/recycle drop connections the server closed
+    db_pool_size: int = Field(default=int(os.getenv("DB_POOL_SIZE", "10")))
+    db_max_overflow: int = Field(default=int(os.getenv("DB_MAX_OVERFLOW", "10")))
+    db_pool_timeout_s: float = Field(default=float(os.getenv("DB_POOL_TIMEOUT_S", "10")))
+    db_pool_recycle_s: int = Field(default=int(os.getenv("DB_POOL_RECYCLE_S", "1800")))
+    db_pool_pre_ping: bool = Field(default=os.getenv("DB_POOL_PRE_PING", "true").lower() == "true")
+
     config_path: str = Field(default=os.getenv("CONFIG_PATH", "/app/configs/default.yml"))
 
 settings = Settings()
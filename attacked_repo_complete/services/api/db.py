@@ -1,6 +1,99 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, inspect, select, text, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
 from .config import settings
+from .models import Briefing, Slice
 
-engine = create_engine(settings.database_url, future=True)
+# Async drivers for the API's read routes, by backend
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def pool_options(url: str) -> dict:
+    """QueuePool sizing from settings; SQLite keeps SQLAlchemy's own pool choice."""
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_s,
+        "pool_recycle": settings.db_pool_recycle_s,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def async_url(url: str) -> str:
+    """DATABASE_URL with its driver swapped for the asyncio one (psycopg2 → asyncpg)."""
+    u = make_url(url)
+    backend = u.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"no async driver configured for {backend}")
+    return u.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+engine = create_engine(settings.database_url, future=True, **pool_options(settings.database_url))
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, future=True)
+
+_async_engine = None
+
+
+def async_engine():
+    """
+    Process-wide AsyncEngine for the API's read routes, created on first use so
+    workers (and scripts) never load the async driver.
+    """
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        _async_engine = create_async_engine(async_url(settings.database_url), **pool_options(settings.database_url))
+    return _async_engine
+
+
+def async_session():
+    from sqlalchemy.ext.asyncio import AsyncSession
+    # Rows are serialized after commit/close; nothing should lazy-load on an expired instance
+    return AsyncSession(async_engine(), autoflush=False, expire_on_commit=False)
+
+
+def sync_schema(metadata):
+    """
+    Companion to create_all for tables that already exist: adds columns and
+    indexes introduced since the table was created. Additive only.
+    """
+    insp = inspect(engine)
+    with engine.begin() as conn:
+        for table in metadata.sorted_tables:
+            if not insp.has_table(table.name):
+                continue
+            existing = {c["name"] for c in insp.get_columns(table.name)}
+            for col in table.columns:
+                if col.name not in existing:
+                    ctype = col.type.compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {col.name} {ctype}"))
+            for idx in table.indexes:
+                idx.create(conn, checkfirst=True)  # honours Index.ddl_if (e.g. PG-only GIN)
+
+
+def backfill_briefings(batch: int = 500) -> int:
+    """
+    Fill the denormalized list-filter columns (Briefing.composite, risk_tags)
+    on rows written before they existed: composite from the stored scores,
+    risk tags as the union of the briefing's slice tags. Only rows with SQL
+    NULL risk_tags are touched, so once done this is a cheap no-op.
+    """
+    n = 0
+    with Session(engine) as db:
+        while True:
+            rows = db.execute(select(Briefing.id, Briefing.scores).where(Briefing.risk_tags.is_(None))
+                              .limit(batch)).all()
+            if not rows:
+                return n
+            tags = {r.id: set() for r in rows}
+            for bid, slice_tags in db.execute(select(Slice.briefing_id, Slice.risk_tags)
+                                              .where(Slice.briefing_id.in_(tags))):
+                tags[bid].update(slice_tags or [])
+            db.execute(update(Briefing), [
+                {"id": r.id, "composite": (r.scores or {}).get("composite"), "risk_tags": sorted(tags[r.id])}
+                for r in rows
+            ])
+            db.commit()
+            n += len(rows)
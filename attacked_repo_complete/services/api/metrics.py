@@ -0,0 +1,85 @@
+import os, time
+from contextlib import contextmanager
+from prometheus_client import CollectorRegistry, Histogram, generate_latest, start_http_server
+from prometheus_client import CONTENT_TYPE_LATEST, multiprocess
+from sqlalchemy import event
+
+# Prometheus metrics shared by the API and the workers. Under prefork Celery or
+# multi-process uvicorn set PROMETHEUS_MULTIPROC_DIR so samples from all child
+# processes are merged at scrape time.
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+STAGE_SECONDS = Histogram("attacked_stage_seconds", "Pipeline stage duration", ["stage"], buckets=STAGE_BUCKETS)
+JOB_SECONDS = Histogram("attacked_job_seconds", "process_briefing wall time per job", ["status"], buckets=STAGE_BUCKETS)
+QUEUE_WAIT_SECONDS = Histogram("attacked_queue_wait_seconds", "Time between publish and task start", ["task"],
+                               buckets=STAGE_BUCKETS)
+DB_SECONDS = Histogram("attacked_db_query_seconds", "SQL statement execution time", ["role"],
+                       buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5))
+HTTP_SECONDS = Histogram("attacked_http_request_seconds", "API request latency", ["method", "route", "status"],
+                         buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+
+
+class StageTimer:
+    """
+    Accumulates per-stage wall time for one job (or one slice) and observes each
+    stage in the attacked_stage_seconds histogram. `breakdown()` is what gets
+    stored on Job.timings: {stage: {"total_s", "count", "max_s"}}.
+    """
+    def __init__(self):
+        self.stages: dict[str, dict] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - t0)
+
+    def record(self, name: str, seconds: float):
+        STAGE_SECONDS.labels(name).observe(seconds)
+        s = self.stages.setdefault(name, {"total_s": 0.0, "count": 0, "max_s": 0.0})
+        s["total_s"] += seconds
+        s["count"] += 1
+        s["max_s"] = max(s["max_s"], seconds)
+
+    def merge(self, stages: dict):
+        """Fold in a breakdown from another timer (e.g. a fanned-out slice) without re-observing."""
+        for name, o in stages.items():
+            s = self.stages.setdefault(name, {"total_s": 0.0, "count": 0, "max_s": 0.0})
+            s["total_s"] += o["total_s"]
+            s["count"] += o["count"]
+            s["max_s"] = max(s["max_s"], o["max_s"])
+
+    def breakdown(self) -> dict:
+        return {k: {"total_s": round(v["total_s"], 4), "count": v["count"], "max_s": round(v["max_s"], 4)}
+                for k, v in self.stages.items()}
+
+
+def instrument_engine(engine, role: str):
+    """Time every SQL statement on `engine` into attacked_db_query_seconds{role}."""
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, params, context, executemany):
+        conn.info.setdefault("_q_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _stop(conn, cursor, statement, params, context, executemany):
+        DB_SECONDS.labels(role).observe(time.perf_counter() - conn.info["_q_start"].pop())
+
+
+def registry():
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        reg = CollectorRegistry()
+        multiprocess.MultiProcessCollector(reg)
+        return reg
+    from prometheus_client import REGISTRY
+    return REGISTRY
+
+
+def render() -> tuple[bytes, str]:
+    return generate_latest(registry()), CONTENT_TYPE_LATEST
+
+
+def serve(port: int):
+    """Standalone /metrics listener (used by Celery workers)."""
+    start_http_server(port, registry=registry())
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, Float, ForeignKey, JSON, Integer
+from sqlalchemy import String, DateTime, Float, ForeignKey, JSON, Integer, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 import uuid
 
@@ -14,6 +15,8 @@ class Job(Base):
     error: Mapped[str | None] = mapped_column(String(512))
     briefing_id: Mapped[str | None] = mapped_column(String(36))
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Profiling breakdown: queue_wait_s, wall_s, stages {name: {total_s, count, max_s}}
+    timings: Mapped[dict | None] = mapped_column(JSON)
 
 class Briefing(Base):
     __tablename__ = "briefings"
@@ -25,18 +28,42 @@ class Briefing(Base):
     highlights: Mapped[list] = mapped_column(JSON)
     volatility: Mapped[dict] = mapped_column(JSON)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Denormalized for list filtering: scores["composite"] and the union of slice risk tags
+    composite: Mapped[float | None] = mapped_column(Float)
+    risk_tags: Mapped[list | None] = mapped_column(JSON().with_variant(JSONB(), "postgresql"))
+    # cache.scoring_version() the scores were computed with; NULL/stale rows get rescored
+    scoring_version: Mapped[str | None] = mapped_column(String(16))
+    # MinIO key of the source media (presigned for clients)
+    source_key: Mapped[str | None] = mapped_column(String(512))
     slices: Mapped[list['Slice']] = relationship(back_populates="briefing", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_briefings_created_at_id", "created_at", "id"),  # keyset pagination
+        Index("ix_briefings_composite", "composite"),
+        Index("ix_briefings_risk_tags", "risk_tags", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+
 class Slice(Base):
     __tablename__ = "slices"
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    briefing_id: Mapped[str] = mapped_column(ForeignKey("briefings.id"))
+    briefing_id: Mapped[str] = mapped_column(ForeignKey("briefings.id"), index=True)
     t_start: Mapped[int] = mapped_column(Integer)
     t_end: Mapped[int] = mapped_column(Integer)
     transcript: Mapped[str] = mapped_column(String)
     metrics: Mapped[dict] = mapped_column(JSON)
     risk_tags: Mapped[list] = mapped_column(JSON)
-    thumbnails: Mapped[list] = mapped_column(JSON)
+    thumbnails: Mapped[list] = mapped_column(JSON)  # MinIO keys (older rows: local paths)
     au: Mapped[dict] = mapped_column(JSON)
+    audio_key: Mapped[str | None] = mapped_column(String(512))  # UPLOAD_SLICE_AUDIO
 
     briefing: Mapped[Briefing] = relationship(back_populates="slices")
+
+
+def transcript_tsvector():
+    """
+    Full-text expression over Slice.transcript. Queries must use this exact
+    expression so Postgres can match it to the GIN index below.
+    """
+    return func.to_tsvector(text("'english'"), func.coalesce(Slice.__table__.c.transcript, text("''")))
+
+Index("ix_slices_transcript_fts", transcript_tsvector(), postgresql_using="gin").ddl_if(dialect="postgresql")
@@ -0,0 +1,106 @@
+import json, redis, time
+import redis.asyncio as aioredis
+from .config import settings
+
+# Cheap, frequently-updated job progress lives in Redis rather than on the Job row
+_redis = redis.Redis.from_url(settings.redis_url)
+_TTL = 86400
+
+# Live job events: every update is also published on a per-job pub/sub channel
+# (consumed by the SSE endpoint); finished slices are kept in a list for replay.
+TERMINAL_EVENTS = ("done", "failed")
+
+
+def channel(job_id: str) -> str:
+    return f"attacked:job:{job_id}:events"
+
+
+def publish(job_id: str, event: str, data: dict):
+    _redis.publish(channel(job_id), json.dumps({"event": event, "data": data}))
+
+
+def push_slice(job_id: str, result: dict, partial: dict | None = None):
+    """Record a finished slice for late subscribers and publish it (with the partial aggregate, if any)."""
+    data = {k: result[k] for k in ("idx", "t_start", "t_end", "transcript", "metrics", "risk_tags")}
+    key = f"attacked:job:{job_id}:slices"
+    _redis.rpush(key, json.dumps(data))
+    _redis.expire(key, _TTL)
+    publish(job_id, "slice", {**data, "partial": partial})
+
+
+async def get_slices(job_id: str) -> list[dict]:
+    return [json.loads(v) for v in await _async().lrange(f"attacked:job:{job_id}:slices", 0, -1)]
+
+
+def clear_slices(job_id: str):
+    _redis.delete(f"attacked:job:{job_id}:slices")
+
+
+_aredis = None
+
+
+def _async() -> aioredis.Redis:
+    """Async client for the API process (readers below and SSE pub/sub)."""
+    global _aredis
+    if _aredis is None:
+        _aredis = aioredis.Redis.from_url(settings.redis_url)
+    return _aredis
+
+
+def subscribe():
+    """Async pub/sub handle (one per SSE connection)."""
+    return _async().pubsub()
+
+
+def set_download(job_id: str, done: int, total: int | None):
+    key = f"attacked:job:{job_id}:download"
+    _redis.hset(key, mapping={"done": done, "total": total or 0})
+    _redis.expire(key, _TTL)
+    publish(job_id, "download", {"bytes_downloaded": done, "bytes_total": total})
+
+
+def set_progress(job_id: str, pct: int, step: str | None = None):
+    key = f"attacked:job:{job_id}:progress"
+    _redis.hset(key, mapping={"progress": int(pct), "step": step or ""})
+    _redis.expire(key, _TTL)
+    publish(job_id, "progress", {"progress": int(pct), "step": step or ""})
+
+
+async def get_live(job_id: str) -> tuple[int | None, int | None, int | None]:
+    """(bytes downloaded, bytes total, progress %) in one round trip."""
+    dl, pct = await _async().pipeline(transaction=False) \
+        .hgetall(f"attacked:job:{job_id}:download") \
+        .hget(f"attacked:job:{job_id}:progress", "progress").execute()
+    done, total = (int(dl[b"done"]), int(dl[b"total"]) or None) if dl else (None, None)
+    return done, total, int(pct) if pct is not None else None
+
+
+def incr_slices_done(job_id: str) -> int:
+    key = f"attacked:job:{job_id}:slices_done"
+    n = _redis.incr(key)
+    _redis.expire(key, _TTL)
+    return n
+
+
+def reset_slices_done(job_id: str):
+    _redis.delete(f"attacked:job:{job_id}:slices_done")
+
+
+class ProgressReporter:
+    """
+    Publishes every progress update to Redis (and the Celery task state), but
+    writes job.progress to the DB at most once per `flush_s` seconds
+    """
+    def __init__(self, db, job, task=None, flush_s: float | None = None):
+        self.db, self.job, self.task = db, job, task
+        self.flush_s = settings.progress_flush_s if flush_s is None else flush_s
+        self._last_flush = time.monotonic()
+
+    def update(self, pct: int, step: str | None = None):
+        set_progress(self.job.id, pct, step)
+        if self.task is not None:
+            self.task.update_state(state="PROCESSING", meta={"progress": pct, "step": step})
+        if time.monotonic() - self._last_flush >= self.flush_s:
+            self.job.progress = pct
+            self.db.commit()
+            self._last_flush = time.monotonic()
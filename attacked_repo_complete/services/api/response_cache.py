@@ -0,0 +1,151 @@
+import gzip, hashlib, logging, threading, time
+from collections import OrderedDict
+import redis
+import redis.asyncio as aioredis
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Read-through cache of serialized briefing/slice responses. Finished briefings
+# only change on rescore or delete, both of which bump a per-briefing generation
+# counter in Redis; entries from an older generation are ignored, which keeps the
+# per-process LRUs of every API worker coherent without any broadcast. Bodies
+# that embed presigned URLs are additionally built with a ttl shorter than the
+# URLs' own expiry.
+_redis = redis.Redis.from_url(settings.redis_url)
+_aredis = None
+_TTL = settings.result_ttl_days * 86400
+
+
+class Entry:
+    __slots__ = ("gen", "etag", "body", "expires", "_gz")
+
+    def __init__(self, gen: int, etag: str, body: bytes, expires: float | None = None):
+        self.gen, self.etag, self.body, self.expires = gen, etag, body, expires
+        self._gz = None
+
+    def fresh(self, gen: int) -> bool:
+        return self.gen == gen and (self.expires is None or self.expires > time.time())
+
+    @property
+    def gz(self) -> bytes:
+        # Compressed once per cached entry, not per request
+        if self._gz is None:
+            self._gz = gzip.compress(self.body, compresslevel=6)
+        return self._gz
+
+
+class LRU:
+    """Thread-safe LRU bounded by total body bytes."""
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._d: OrderedDict[str, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Entry | None:
+        with self._lock:
+            e = self._d.get(key)
+            if e is not None:
+                self._d.move_to_end(key)
+            return e
+
+    def put(self, key: str, e: Entry):
+        if len(e.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._d.pop(key, None)
+            if old is not None:
+                self.size -= len(old.body)
+            self._d[key] = e
+            self.size += len(e.body)
+            while self.size > self.max_bytes:
+                _k, ev = self._d.popitem(last=False)
+                self.size -= len(ev.body)
+
+    def discard(self, key: str):
+        with self._lock:
+            e = self._d.pop(key, None)
+            if e is not None:
+                self.size -= len(e.body)
+
+
+_local = LRU(settings.response_cache_max_mb << 20)
+KINDS = ("briefing", "slices")
+
+
+def _gen_key(briefing_id: str) -> str:
+    return f"attacked:resp:gen:{briefing_id}"
+
+
+def _body_key(kind: str, briefing_id: str, gen: int) -> str:
+    return f"attacked:resp:{kind}:{briefing_id}:{gen}"
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _async() -> aioredis.Redis:
+    global _aredis
+    if _aredis is None:
+        _aredis = aioredis.Redis.from_url(settings.redis_url)
+    return _aredis
+
+
+async def get_or_build(kind: str, briefing_id: str, build, ttl: int | None = None) -> Entry | None:
+    """
+    Return the cached response for (kind, briefing_id), awaiting build() -> bytes | None
+    on a miss. None from build() (e.g. not found) is passed through and not cached.
+    `kind` may carry a variant suffix (e.g. selected fields); variants are
+    invalidated by the generation bump like everything else. `ttl` (seconds)
+    bounds the age of the entry on top of that.
+    """
+    if not settings.response_cache:
+        body = await build()
+        return Entry(0, etag_for(body), body) if body is not None else None
+    key = f"{kind}:{briefing_id}"
+    r = _async()
+    try:
+        gen = int(await r.get(_gen_key(briefing_id)) or 0)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache unavailable ({e}); serving uncached")
+        body = await build()
+        return Entry(0, etag_for(body), body) if body is not None else None
+
+    e = _local.get(key)
+    if e is not None and e.fresh(gen):
+        return e
+    if settings.response_cache_redis:
+        bkey = _body_key(kind, briefing_id, gen)
+        body, left = await r.pipeline().get(bkey).ttl(bkey).execute()
+        if body is not None:
+            e = Entry(gen, etag_for(body), body, expires=time.time() + left if ttl and left > 0 else None)
+            _local.put(key, e)
+            return e
+
+    body = await build()
+    if body is None:
+        return None
+    e = Entry(gen, etag_for(body), body, expires=time.time() + ttl if ttl else None)
+    _local.put(key, e)
+    if settings.response_cache_redis:
+        await r.set(_body_key(kind, briefing_id, gen), body, ex=min(ttl, _TTL) if ttl else _TTL)
+    return e
+
+
+def invalidate(briefing_ids):
+    """Bump the generation of each briefing (after rescore/delete) and drop shared copies."""
+    ids = list(briefing_ids)
+    if not ids:
+        return
+    # Generation keys never expire: resetting to 0 could revive a stale entry held by another process
+    pipe = _redis.pipeline()
+    for bid in ids:
+        pipe.incr(_gen_key(bid))
+    gens = pipe.execute()
+    if settings.response_cache_redis:
+        _redis.delete(*(_body_key(kind, bid, gen - 1) for bid, gen in zip(ids, gens) for kind in KINDS))
+    for bid in ids:
+        for kind in KINDS:
+            _local.discard(f"{kind}:{bid}")
@@ -7,6 +7,9 @@ class JobStatus(BaseModel):
     progress: int
     error: Optional[str] = None
     briefing_id: Optional[str] = None
+    bytes_downloaded: Optional[int] = None
+    bytes_total: Optional[int] = None
+    timings: Optional[Dict[str, Any]] = None
 
 class BriefingOut(BaseModel):
     id: str
@@ -17,6 +20,7 @@ class BriefingOut(BaseModel):
     highlights: List[Dict[str, Any]]
     volatility: Dict[str, float]
     created_at: str
+    source_url: Optional[str] = None
 
 class SliceOut(BaseModel):
     slice_id: str
@@ -27,3 +31,16 @@ class SliceOut(BaseModel):
     risk_tags: List[str]
     thumbnails: List[str]
     au: Dict[str, float]
+    audio_url: Optional[str] = None
+
+class SearchHit(BaseModel):
+    briefing_id: str
+    slice_id: str
+    t_start: int
+    t_end: int
+    rank: float
+    snippet: str
+
+class SearchResults(BaseModel):
+    hits: List[SearchHit]
+    next_offset: Optional[int] = None
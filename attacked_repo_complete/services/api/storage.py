@@ -1,22 +1,126 @@
+import logging, os, threading
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import Config
+from botocore.exceptions import ClientError
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
 session = boto3.session.Session()
+# Connection pool sized for the upload threads plus multipart parts in flight
+_config = Config(signature_version='s3v4', max_pool_connections=settings.s3_max_pool_connections,
+                 connect_timeout=settings.s3_timeout_s, read_timeout=settings.s3_timeout_s)
 s3 = session.client(
     's3',
     endpoint_url=f"http://{settings.minio_endpoint}",
     aws_access_key_id=settings.minio_access_key,
     aws_secret_access_key=settings.minio_secret_key,
+    config=_config,
+    region_name='us-east-1')
+# Presigned URLs are signed for the host the browser will use
+_presigner = session.client(
+    's3',
+    endpoint_url=settings.minio_public_url or f"http://{settings.minio_endpoint}",
+    aws_access_key_id=settings.minio_access_key,
+    aws_secret_access_key=settings.minio_secret_key,
     config=Config(signature_version='s3v4'),
     region_name='us-east-1')
 
 BUCKET = settings.minio_bucket
 
+# Multipart above 8 MB so large uploads stream in parts instead of one PUT
+TRANSFER = TransferConfig(multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024)
+
 def put_object(key: str, data: bytes, content_type: str):
     s3.put_object(Bucket=BUCKET, Key=key, Body=data, ContentType=content_type)
     return f"s3://{BUCKET}/{key}"
 
-def put_file(key: str, file_path: str):
-    s3.upload_file(file_path, BUCKET, key)
+def put_file(key: str, file_path: str, content_type: str | None = None):
+    extra = {"ContentType": content_type} if content_type else None
+    s3.upload_file(file_path, BUCKET, key, ExtraArgs=extra, Config=TRANSFER)
     return f"s3://{BUCKET}/{key}"
+
+def put_fileobj(key: str, fileobj, content_type: str | None = None):
+    extra = {"ContentType": content_type} if content_type else None
+    s3.upload_fileobj(fileobj, BUCKET, key, ExtraArgs=extra, Config=TRANSFER)
+    return f"s3://{BUCKET}/{key}"
+
+def get_fileobj(key: str, fileobj, callback=None):
+    s3.download_fileobj(BUCKET, key, fileobj, Config=TRANSFER, Callback=callback)
+
+def object_size(key: str) -> int:
+    return int(s3.head_object(Bucket=BUCKET, Key=key)["ContentLength"])
+
+def exists(key: str) -> bool:
+    try:
+        s3.head_object(Bucket=BUCKET, Key=key)
+        return True
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return False
+        raise
+
+def presign(key: str, expires_s: int | None = None) -> str:
+    return _presigner.generate_presigned_url("get_object", Params={"Bucket": BUCKET, "Key": key},
+                                             ExpiresIn=expires_s or settings.presign_ttl_s)
+
+def artifact_url(ref: str | None) -> str | None:
+    """Object key → presigned URL; legacy local paths (rows from before uploads) pass through."""
+    if not ref or ref.startswith("/"):
+        return ref
+    return presign(ref)
+
+
+def _put_and_close(key: str, f, content_type: str | None):
+    with f:
+        put_fileobj(key, f, content_type)
+
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+def _executor() -> ThreadPoolExecutor:
+    # Created lazily so each prefork child gets its own threads
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=settings.upload_workers, thread_name_prefix="upload")
+        return _pool
+
+
+class ArtifactUploader:
+    """
+    Queues files for upload on a bounded per-process thread pool so the
+    pipeline keeps analyzing while artifacts stream to MinIO. `submit` opens
+    the file right away (so removing the job workspace can't race the upload)
+    and returns the object key; `finish` waits for everything submitted.
+    """
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self._pending: list[tuple[str, object]] = []
+        self._failed: set[str] = set()
+
+    def submit(self, path: str, key: str | None = None, content_type: str | None = None) -> str:
+        key = key or f"{self.prefix}/{os.path.basename(path)}"
+        try:
+            f = open(path, "rb")
+        except OSError as e:
+            logger.warning(f"Artifact upload failed for {key}: {e}")
+            self._failed.add(key)
+            return key
+        self._pending.append((key, _executor().submit(_put_and_close, key, f, content_type)))
+        return key
+
+    def finish(self) -> set[str]:
+        """Block until all submitted uploads are done; returns the keys that failed."""
+        failed, self._failed = self._failed, set()
+        for key, fut in self._pending:
+            try:
+                fut.result()
+            except Exception as e:
+                logger.warning(f"Artifact upload failed for {key}: {e}")
+                failed.add(key)
+        self._pending.clear()
+        return failed
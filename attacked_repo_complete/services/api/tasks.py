@@ -1,153 +1,391 @@
-from .celery_app import celery_app
+from .celery_app import celery_app, NATIVE_THREADS, SHORT_QUEUE, LONG_QUEUE
+from celery import chord, group
+from celery.exceptions import Retry, SoftTimeLimitExceeded
+from celery.signals import worker_process_init, worker_init, task_prerun
 import uuid
 import os
+import time
 from pathlib import Path
+from itertools import groupby
+from sqlalchemy import insert, select, update, or_
 from sqlalchemy.orm import Session
-from .db import SessionLocal
+from .db import SessionLocal, engine
 from .models import Briefing, Job, Slice
+from .config import settings
+from . import cache, metrics, progress, response_cache, storage, workspace
 import logging
+import httpx
 
 # Analyzer modules
-from analyzer.media_prep import slice_video, prepare_slice
-from analyzer.asr import transcribe as asr_transcribe
-from analyzer.nlp_metrics import score_content, detect_risks
-from analyzer.delivery_metrics import score_delivery, estimate_nonverbal
-from analyzer.impact_metrics import score_impact, detect_media_risks
-from analyzer.aggregation import aggregate_briefing
+from analyzer.media_prep import slice_video, segment_video, prepare_slice, decode_audio, load_pcm, slice_pcm
+from analyzer.media_prep import probe_duration, AUDIO_SR
+from analyzer.asr import transcribe as asr_transcribe, transcribe_pcm as asr_transcribe_pcm
+from analyzer.asr import transcribe_stream, bucket_words, preload as asr_preload
+from analyzer.nlp_metrics import score_content, score_content_batch, detect_risks
+from analyzer.delivery_metrics import frame_features, load_audio, pcm_to_float, speaking_rate
+from analyzer.delivery_metrics import score_delivery_features, estimate_nonverbal, FEATURES_VERSION
+from analyzer.impact_metrics import score_impact, score_impact_batch, detect_media_risks
+from analyzer.aggregation import aggregate_briefing, BriefingAggregator
 
 logger = logging.getLogger(__name__)
 
 
-@celery_app.task(name="api.tasks.process_briefing", bind=True)
-def process_briefing(self, local_path: str, object_key: str | None = None, slice_len: int = 45):
+@worker_process_init.connect
+def _preload_asr(**_):
+    # Pay the Vosk model load once per worker process instead of on the first slice
+    if not asr_preload():
+        logger.warning("Vosk model not available; ASR will fall back to empty transcripts")
+
+
+@worker_process_init.connect
+def _instrument_db(**_):
+    # Pooled connections inherited from the parent are dropped (not closed) so
+    # forked children never share a socket; each child opens its own
+    engine.dispose(close=False)
+    metrics.instrument_engine(engine, "worker")
+
+
+@worker_process_init.connect
+def _cap_native_threads(**_):
+    # BLAS pools are capped via env in celery_app; OpenCV needs an explicit call
+    import cv2
+    cv2.setNumThreads(int(NATIVE_THREADS))
+
+
+def _media_queue(duration_s: float | None) -> tuple[str, int]:
+    """(queue, hard time limit) for a job by media duration; unknown counts as long."""
+    if duration_s is not None and duration_s <= settings.long_media_s:
+        return SHORT_QUEUE, settings.short_time_limit_s
+    return LONG_QUEUE, settings.long_time_limit_s
+
+
+@worker_init.connect
+def _serve_metrics(**_):
+    # Main worker process only; children write to PROMETHEUS_MULTIPROC_DIR
+    if settings.worker_metrics_port:
+        metrics.serve(settings.worker_metrics_port)
+
+
+@worker_init.connect
+def _sweep_workspaces(**_):
+    # Scratch dirs of jobs killed mid-run (worker crash, hard time limit) are never cleaned up otherwise
+    n = workspace.sweep(settings.workspace_max_age_h * 3600)
+    if n:
+        logger.info(f"Removed {n} stale workspace entries")
+
+
+@task_prerun.connect
+def _observe_queue_wait(task=None, **_):
+    sent_at = getattr(task.request, "sent_at", None)
+    if sent_at:
+        task.request.queue_wait_s = max(0.0, time.time() - sent_at)
+        metrics.QUEUE_WAIT_SECONDS.labels(task.name.rsplit(".", 1)[-1]).observe(task.request.queue_wait_s)
+
+
+def _analyze_slice(sm: dict, uploader: storage.ArtifactUploader | None = None) -> dict:
     """
-    Complete BFI pipeline processing task
+    Run one slice through prepare → ASR → content/delivery/impact scoring.
+    The result carries this slice's stage breakdown under "timings". With an
+    uploader, thumbnails (and the wav, if enabled) are queued for MinIO right
+    after extraction and the result holds their object keys.
     """
-    try:
-        # Resolve job id from Celery task context
-        job_id = getattr(self.request, "id", None)
+    timer = metrics.StageTimer()
+    result = _analyze_slice_timed(sm, timer, uploader)
+    result["timings"] = timer.breakdown()
+    return result
+
+
+def _analyze_slice_timed(sm: dict, timer: metrics.StageTimer, uploader: storage.ArtifactUploader | None) -> dict:
+    # Prepare slice: extract wav + thumbnail (thumbnail only when audio is shared)
+    pcm = wav_path = audio_key = None
+    with timer.stage("prepare_slice"):
+        if "pcm_path" in sm:
+            pcm = slice_pcm(load_pcm(sm["pcm_path"]), sm["t_start"], sm["t_end"])
+            _wav, thumbnails = prepare_slice(sm, audio=False)
+        else:
+            wav_path, thumbnails = prepare_slice(sm, audio_dir=sm.get("audio_dir"))
+    if uploader is not None:
+        # Uploads run on the pool while this slice is transcribed and scored
+        thumbnails = [uploader.submit(t, content_type="image/jpeg") for t in thumbnails]
+        if settings.upload_slice_audio and wav_path:
+            audio_key = uploader.submit(wav_path, content_type="audio/wav")
+    base = {"idx": sm["idx"], "t_start": sm["t_start"], "t_end": sm["t_end"], "thumbnails": thumbnails,
+            "audio_key": audio_key}
+
+    # Motion comes from the video, so it is never taken from the audio-keyed slice cache
+    with timer.stage("estimate_nonverbal"):
+        nonverbal = estimate_nonverbal(sm["video_path"], sample_fps=settings.motion_sample_fps,
+                                       max_side=settings.motion_max_side, use_ffmpeg=settings.motion_ffmpeg)  # simple motion proxy
+
+    # Per-slice cache keyed by slice audio hash (lets overlapping uploads reuse work)
+    audio_hash = None
+    if sm.get("cache_fp"):
+        audio_hash = cache.hash_buffer(pcm) if pcm is not None else cache.hash_file(wav_path)
+        cached = cache.get_slice(audio_hash, sm["cache_fp"])
+        if cached:
+            return {**base, **cached, "au": nonverbal, "asr_ok": True}
+
+    # ASR - extract transcript (graceful fallback if model missing)
+    asr_ok = True
+    if "transcript" in sm:
+        transcript = sm["transcript"]  # already bucketed from the whole-file stream
+        asr_ok = not sm.get("asr_failed")
+    else:
+        try:
+            with timer.stage("transcribe"):
+                transcript, _words = asr_transcribe_pcm(pcm) if pcm is not None else asr_transcribe(wav_path)
+        except Exception as e:
+            logger.warning(f"ASR failed for slice {sm['idx']}: {e}; using empty transcript")
+            transcript = ""
+            asr_ok = False
+
+    # NLP - analyze content
+    with timer.stage("score_content"):
+        content_scores = score_content(transcript)
+
+    # Delivery - analyze audio/visual delivery
+    with timer.stage("score_delivery"):
+        # Frame features depend only on the audio, so they outlive scoring-version changes
+        features = cache.get_features(audio_hash, FEATURES_VERSION) if audio_hash else None
+        if features is None:
+            features = frame_features(pcm_to_float(pcm) if pcm is not None else load_audio(wav_path))
+            if audio_hash:
+                cache.set_features(audio_hash, FEATURES_VERSION, features)
+        delivery_scores = score_delivery_features(features, transcript)
+
+    # Impact - analyze potential impact
+    with timer.stage("score_impact"):
+        impact_scores = score_impact(transcript, content_scores, delivery_scores)
+
+        # Risk tags (union of NLP + media-sensitive)
+        risk_tags = sorted(list(set(detect_risks(transcript) + detect_media_risks(transcript))))
+
+    analysis = {
+        "transcript": transcript,
+        "metrics": {
+            "content": content_scores,
+            "delivery": {**delivery_scores},
+            "impact": impact_scores,
+            # Raw prosody features; not part of the delivery score average
+            "delivery_features": {k: round(v, 4) for k, v in {**features, **speaking_rate(features, transcript)}.items()},
+        },
+        "risk_tags": risk_tags,
+    }
+    # An empty transcript from a failed ASR run must not be served to later uploads
+    if audio_hash and asr_ok:
+        cache.set_slice(audio_hash, sm["cache_fp"], analysis)
+    return {**base, **analysis, "au": nonverbal, "asr_ok": asr_ok}
+
+
+def _artifact_uploader(job_id: str) -> storage.ArtifactUploader | None:
+    return storage.ArtifactUploader(f"artifacts/{job_id}") if settings.upload_artifacts else None
+
+
+def _finish_uploads(uploader: storage.ArtifactUploader | None, results: list, timer: metrics.StageTimer):
+    """Wait for queued artifact uploads; keys that failed to upload are dropped from the results."""
+    if uploader is None:
+        return
+    with timer.stage("upload_wait"):
+        failed = uploader.finish()
+    for r in results if failed else ():
+        r["thumbnails"] = [t for t in r["thumbnails"] if t not in failed]
+        if r.get("audio_key") in failed:
+            r["audio_key"] = None
+
+
+def _remember_briefing(media_hash: str | None, slice_len: int, briefing_id: str, results: list):
+    # Not when any slice's ASR failed (e.g. no Vosk model): the next upload is re-analyzed
+    if settings.result_cache and media_hash and all(r.get("asr_ok", True) for r in results):
+        cache.set_briefing_id(media_hash, cache.fingerprint(slice_len), briefing_id)
+
 
-        # Open DB session
-        db: Session = SessionLocal()
+def _job_timings(job: Job, timer: metrics.StageTimer) -> dict:
+    """Job.timings: queue wait, wall time since the job started processing, stage breakdown."""
+    prev = job.timings or {}
+    wall = round(time.time() - prev["started_at"], 3) if prev.get("started_at") else None
+    return {**prev, "wall_s": wall, "stages": timer.breakdown()}
 
+
+def _persist_briefing(db: Session, job: Job, results: list, local_path: str, slice_len: int,
+                      agg: dict | None = None, timer: metrics.StageTimer | None = None,
+                      source_key: str | None = None) -> Briefing:
+    """
+    Aggregate slice results (unless an incremental snapshot is passed) and store
+    the Briefing, its Slice rows (one bulk INSERT) and the job's SUCCESS state
+    and timings in a single transaction
+    """
+    timer = timer or metrics.StageTimer()
+    if agg is None:
+        with timer.stage("aggregate"):
+            agg = aggregate_briefing(results, slice_len_s=slice_len)
+    t_persist = time.perf_counter()
+
+    briefing = Briefing(
+        video_src=local_path,
+        duration_s=int(agg.get("duration_s", 0)),
+        slice_len_s=int(slice_len),
+        scores=agg.get("scores", {}),
+        highlights=agg.get("highlights", []),
+        volatility=agg.get("volatility", {}),
+        composite=agg.get("scores", {}).get("composite"),
+        risk_tags=sorted({t for r in results for t in r["risk_tags"]}),
+        scoring_version=cache.scoring_version(),
+        source_key=source_key,
+    )
+    db.add(briefing)
+    db.flush()  # Briefing row must exist before the slice FK inserts
+
+    if results:
+        db.execute(insert(Slice), [
+            {
+                "briefing_id": briefing.id,
+                "t_start": int(r["t_start"]),
+                "t_end": int(r["t_end"]),
+                "transcript": r["transcript"],
+                "metrics": r["metrics"],
+                "risk_tags": r["risk_tags"],
+                "thumbnails": r["thumbnails"],
+                "au": r["au"],
+                "audio_key": r.get("audio_key"),
+            } for r in results
+        ])
+
+    job.status = "SUCCESS"
+    job.progress = 100
+    job.briefing_id = briefing.id
+    timer.record("persist", time.perf_counter() - t_persist)  # excludes the commit itself
+    job.timings = _job_timings(job, timer)
+    db.commit()
+    if job.timings["wall_s"] is not None:
+        metrics.JOB_SECONDS.labels("SUCCESS").observe(job.timings["wall_s"])
+    progress.set_progress(job.id, 100, "Done")
+    progress.clear_slices(job.id)
+    progress.publish(job.id, "done", {"briefing_id": briefing.id})
+    return briefing
+
+
+@celery_app.task(name="api.tasks.process_briefing", bind=True)
+def process_briefing(self, local_path: str, object_key: str | None = None, slice_len: int = 45,
+                     media_hash: str | None = None, duration_s: float | None = None):
+    """
+    Complete BFI pipeline processing task. Intermediates go to the job's
+    workspace, which is removed when the job ends (by finalize_briefing when
+    slices are fanned out).
+    """
+    fanned_out = False
+    # Resolve job id from Celery task context
+    job_id = getattr(self.request, "id", None)
+    db: Session = SessionLocal()
+    job = None
+    try:
         # Update job status to processing
         job = db.query(Job).filter(Job.id == job_id).first()
         if not job:
             raise Exception(f"Job {job_id} not found")
 
-        # Update job progress
+        # Update job status; progress goes to Redis, DB progress is flushed on a timer
         job.status = "PROCESSING"
         job.progress = 0
+        job.timings = {"started_at": time.time(), "queue_wait_s": getattr(self.request, "queue_wait_s", None)}
         db.commit()
+        progress.clear_slices(job_id)
+        reporter = progress.ProgressReporter(db, job, task=self)
+        timer = metrics.StageTimer()
 
         logger.info(f"Starting processing for job {job_id}, file: {local_path}")
 
+        # 0. Same media + same analyzer/config fingerprint → reuse the existing briefing
+        fp = cache.fingerprint(slice_len) if settings.result_cache else None
+        if fp and media_hash:
+            cached_id = cache.get_briefing_id(media_hash, fp)
+            if cached_id and db.get(Briefing, cached_id):
+                job.status = "SUCCESS"
+                job.progress = 100
+                job.briefing_id = cached_id
+                db.commit()
+                progress.publish(job_id, "done", {"briefing_id": cached_id})
+                logger.info(f"Cache hit for job {job_id}: reusing briefing {cached_id}")
+                return {"ok": True, "briefing_id": cached_id, "cached": True}
+
         # 1. Load and validate video file
-        self.update_state(state="PROCESSING", meta={"progress": 10, "step": "Loading video"})
+        reporter.update(10, "Loading video")
         if not os.path.exists(local_path):
             raise Exception(f"Video file not found: {local_path}")
 
-        job.progress = 10
-        db.commit()
-
-        # 2. Slice media
-        self.update_state(state="PROCESSING", meta={"progress": 20, "step": "Slicing media"})
-        slices_meta = slice_video(local_path, slice_len=slice_len)
-
-        job.progress = 20
-        db.commit()
-
-        job.progress = 30
-        db.commit()
+        # 2. Slice media into the job workspace (slice audio on tmpfs when configured and it fits)
+        reporter.update(20, "Slicing media")
+        ws = workspace.get(job_id)
+        audio_dir = ws.audio_dir(int(duration_s * AUDIO_SR * 2)) if duration_s else ws.path
+        with timer.stage("slice_video"):
+            if settings.single_pass_segmenter:
+                slices_meta = segment_video(local_path, slice_len=slice_len, work_dir=ws.path, audio_dir=audio_dir)
+            else:
+                slices_meta = slice_video(local_path, slice_len=slice_len, work_dir=ws.path)
+        for sm in slices_meta:
+            sm["audio_dir"] = audio_dir
+        if settings.shared_audio or settings.streaming_asr:
+            # Decode the audio track once; slices read memory-mapped views of it
+            with timer.stage("decode_audio"):
+                pcm_path = decode_audio(local_path, os.path.join(audio_dir, "audio.pcm"))
+            if settings.shared_audio:
+                for sm in slices_meta:
+                    sm["pcm_path"] = pcm_path
+        if fp:
+            for sm in slices_meta:
+                sm["cache_fp"] = fp
+
+        if settings.streaming_asr:
+            # One recognizer over the whole file, then bucket words by slice time range
+            reporter.update(30, "Transcribing")
+            try:
+                with timer.stage("transcribe"):
+                    words = transcribe_stream(load_pcm(pcm_path))
+            except Exception as e:
+                logger.warning(f"Streaming ASR failed for job {job_id}: {e}; using empty transcripts")
+                words = None
+            for sm, bucket in zip(slices_meta, bucket_words(words or [], slices_meta)):
+                sm["transcript"] = " ".join(w.get("word", "") for w in bucket).strip()
+                if words is None:
+                    sm["asr_failed"] = True  # keeps these empty transcripts out of the result caches
+
+        # 3. Fan out: one Celery task per slice, chord callback aggregates + persists
+        if settings.pipeline_fanout and len(slices_meta) > 1:
+            reporter.update(40, "Analyzing content")
+            total = len(slices_meta)
+            progress.reset_slices_done(job_id)
+            job.timings = {**job.timings, "stages": timer.breakdown()}  # finalize_briefing adds the rest
+            db.commit()
+            queue, _limit = _media_queue(slices_meta[-1]["t_end"])  # slices follow their job's queue
+            callback = finalize_briefing.s(job_id, local_path, slice_len, media_hash, object_key).set(queue=queue) \
+                .on_error(mark_job_failed.s(job_id))
+            chord(analyze_slice.s(sm, job_id, total).set(queue=queue) for sm in slices_meta)(callback)
+            fanned_out = True
+            logger.info(f"Fanned out {total} slices for job {job_id}")
+            return {"ok": True, "fanout": True, "slices_scheduled": total}
 
         # 3. Process each slice through the pipeline
-        self.update_state(state="PROCESSING", meta={"progress": 40, "step": "Analyzing content"})
+        reporter.update(40, "Analyzing content")
         results = []
+        aggregator = BriefingAggregator()
+        uploader = _artifact_uploader(job_id)
         total = max(1, len(slices_meta))
         for i, sm in enumerate(slices_meta):
-            # Prepare slice: extract wav + thumbnail
-            wav_path, thumbnails = prepare_slice(sm)
-
-            # ASR - extract transcript (graceful fallback if model missing)
-            try:
-                transcript, _words = asr_transcribe(wav_path)
-            except Exception as e:
-                logger.warning(f"ASR failed for slice {i}: {e}; using empty transcript")
-                transcript = ""
-
-            # NLP - analyze content
-            content_scores = score_content(transcript)
-
-            # Delivery - analyze audio/visual delivery
-            delivery_scores = score_delivery(wav_path, transcript)
-            nonverbal = estimate_nonverbal(sm["video_path"])  # simple motion proxy
-
-            # Impact - analyze potential impact
-            impact_scores = score_impact(transcript, content_scores, delivery_scores)
-
-            # Risk tags (union of NLP + media-sensitive)
-            risk_tags = sorted(list(set(detect_risks(transcript) + detect_media_risks(transcript))))
-
-            # Accumulate for aggregation and later DB persistence
-            results.append({
-                "idx": sm["idx"],
-                "t_start": sm["t_start"],
-                "t_end": sm["t_end"],
-                "transcript": transcript,
-                "metrics": {
-                    "content": content_scores,
-                    "delivery": {**delivery_scores},
-                    "impact": impact_scores,
-                },
-                "risk_tags": risk_tags,
-                "thumbnails": thumbnails,
-                "au": nonverbal,
-            })
+            results.append(_analyze_slice(sm, uploader))
+            timer.merge(results[-1].get("timings", {}))
+            with timer.stage("aggregate"):
+                aggregator.add(results[-1])
+                snapshot = aggregator.snapshot()
+            progress.push_slice(job_id, results[-1], snapshot)
 
             # Update progress
-            progress = 40 + int((i + 1) / total * 40)
-            job.progress = min(progress, 80)
-            db.commit()
-
-        # 4. Aggregate results
-        self.update_state(state="PROCESSING", meta={"progress": 85, "step": "Aggregating results"})
-        agg = aggregate_briefing(results, slice_len_s=slice_len)
-
-        job.progress = 90
-        db.commit()
-
-        # 5. Create briefing record
-        briefing = Briefing(
-            video_src=local_path,
-            duration_s=int(agg.get("duration_s", 0)),
-            slice_len_s=int(slice_len),
-            scores=agg.get("scores", {}),
-            highlights=agg.get("highlights", []),
-            volatility=agg.get("volatility", {}),
-        )
-        db.add(briefing)
-        db.commit()
-
-        # 6. Persist slices
-        for r in results:
-            srow = Slice(
-                briefing_id=briefing.id,
-                t_start=int(r["t_start"]),
-                t_end=int(r["t_end"]),
-                transcript=r["transcript"],
-                metrics=r["metrics"],
-                risk_tags=r["risk_tags"],
-                thumbnails=r["thumbnails"],
-                au=r["au"],
-            )
-            db.add(srow)
-        db.commit()
+            reporter.update(min(40 + int((i + 1) / total * 40), 80), "Analyzing content")
 
-        # 7. Update job with briefing_id
-        job.status = "SUCCESS"
-        job.progress = 100
-        job.briefing_id = briefing.id
-        db.commit()
+        # 4. Aggregate results and persist briefing + slices
+        reporter.update(85, "Aggregating results")
+        _finish_uploads(uploader, results, timer)
+        briefing = _persist_briefing(db, job, results, local_path, slice_len, agg=snapshot if results else None,
+                                     timer=timer, source_key=object_key)
+        _remember_briefing(media_hash, slice_len, briefing.id, results)
 
         logger.info(f"Successfully processed job {job_id}, created briefing {briefing.id}")
 
@@ -155,7 +393,7 @@ def process_briefing(self, local_path: str, object_key: str | None = None, slice
             "ok": True,
             "briefing_id": briefing.id,
             "slices_processed": len(results),
-            "duration": int(agg.get('duration_s', 0)),
+            "duration": int(briefing.duration_s),
         }
 
     except Exception as e:
@@ -164,13 +402,307 @@ def process_briefing(self, local_path: str, object_key: str | None = None, slice
         # Update job with error
         try:
             job.status = "FAILURE"
-            job.error = str(e)
+            job.error = str(e) or type(e).__name__  # e.g. SoftTimeLimitExceeded has no message
             db.commit()
+            if (job.timings or {}).get("started_at"):
+                metrics.JOB_SECONDS.labels("FAILURE").observe(time.time() - job.timings["started_at"])
         except Exception:
             pass
+        progress.publish(job_id, "failed", {"error": str(e)[:512]})
 
         # Re-raise for Celery
         raise e
+    finally:
+        if not fanned_out:
+            workspace.remove(job_id)
+        db.close()
+
+
+class DownloadTimeout(Exception):
+    pass
+
+
+class _ProgressWriter(cache.HashingWriter):
+    """
+    HashingWriter that also publishes byte-level download progress (throttled)
+    and aborts the transfer once `deadline` (time.monotonic()) has passed
+    """
+    def __init__(self, f, job_id: str, total: int | None, every: int = 1 << 20, deadline: float | None = None):
+        super().__init__(f)
+        self.job_id, self.total, self.every, self.deadline = job_id, total, every, deadline
+        self.done = self._reported = 0
+
+    def write(self, data: bytes):
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DownloadTimeout(f"Download exceeded {settings.download_time_limit_s}s after {self.done} bytes")
+        n = super().write(data)
+        self.done += len(data)
+        if self.done - self._reported >= self.every:
+            progress.set_download(self.job_id, self.done, self.total)
+            self._reported = self.done
+        return n
+
+
+def _admit(task, job_id: str, source_bytes: int | None) -> workspace.Workspace:
+    """Reserve scratch space for the job or retry the task later (Job stays DOWNLOADING meanwhile)."""
+    try:
+        return workspace.create(job_id, workspace.reserve_for(source_bytes))
+    except workspace.DiskBudgetExceeded as e:
+        logger.info(f"Job {job_id} waiting for scratch space: {e}")
+        progress.set_progress(job_id, 0, "Waiting for disk space")
+        raise task.retry(exc=e, countdown=settings.workspace_retry_s, max_retries=settings.workspace_max_waits)
+
+
+@celery_app.task(name="api.tasks.fetch_media", bind=True, time_limit=settings.download_time_limit_s,
+                 soft_time_limit=int(settings.download_time_limit_s * 0.9))
+def fetch_media(self, job_id: str, video_url: str | None = None, object_key: str | None = None,
+                filename: str | None = None, slice_len: int = 45):
+    """
+    Ingestion off the request path: admit the job against the scratch-disk
+    budget (retrying while it is full), pull the remote URL (or the MinIO
+    upload) into the job workspace, hash it, then enqueue process_briefing
+    under the job id.
+
+    The downloader runs on the threads pool, where Celery does not enforce
+    time limits, so the transfer carries its own deadline and socket timeouts.
+    """
+    deadline = time.monotonic() + settings.download_time_limit_s * 0.9
+    db: Session = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise Exception(f"Job {job_id} not found")
+        job.status = "DOWNLOADING"
+        db.commit()
+
+        if video_url:
+            # Per connect/read; the deadline bounds the whole transfer
+            with httpx.stream("GET", video_url, follow_redirects=True, timeout=60) as r:
+                r.raise_for_status()
+                total = int(r.headers["content-length"]) if "content-length" in r.headers else None
+                ws = _admit(self, job_id, total)
+                local_path = ws.file("source.mp4")
+                with open(local_path, "wb") as f:
+                    w = _ProgressWriter(f, job_id, total, deadline=deadline)
+                    for chunk in r.iter_bytes():
+                        w.write(chunk)
+            # Only archived (and so only linkable) when artifact uploads are on
+            object_key = f"uploads/{job_id}/remote.mp4" if settings.upload_artifacts else None
+        else:
+            total = storage.object_size(object_key)
+            ws = _admit(self, job_id, total)
+            local_path = ws.file("source" + os.path.splitext(filename or "")[1])
+            with open(local_path, "wb") as f:
+                w = _ProgressWriter(f, job_id, total, deadline=deadline)
+                storage.get_fileobj(object_key, w)
+        ws.resize(workspace.reserve_for(w.done))
+        progress.set_download(job_id, w.done, total or w.done)
+        logger.info(f"Fetched {w.done} bytes for job {job_id}")
+
+        job.status = "PENDING"
+        db.commit()
+        try:
+            duration = probe_duration(local_path)
+        except Exception as e:
+            logger.warning(f"Could not probe duration for job {job_id}: {e}; routing as long media")
+            duration = None
+        queue, limit = _media_queue(duration)
+        uploader = None
+        if video_url and settings.upload_artifacts:
+            # Remote media is archived to MinIO while the analysis workers run
+            uploader = storage.ArtifactUploader(f"uploads/{job_id}")
+            uploader.submit(local_path, key=object_key, content_type="video/mp4")
+        process_briefing.apply_async(args=[local_path, object_key, slice_len],
+                                     kwargs={"media_hash": w.hexdigest(), "duration_s": duration}, task_id=job_id,
+                                     queue=queue, time_limit=limit, soft_time_limit=int(limit * 0.9))
+        if uploader is not None and uploader.finish():
+            logger.warning(f"Source upload failed for job {job_id}; {object_key} is not in storage")
+        return {"ok": True, "bytes": w.done, "queue": queue}
+    except Retry:
+        raise
+    except Exception as e:
+        logger.error(f"Download failed for job {job_id}: {str(e)}")
+        workspace.remove(job_id)
+        try:
+            job.status = "FAILURE"
+            job.error = str(e)[:512]
+            db.commit()
+        except Exception:
+            pass
+        progress.publish(job_id, "failed", {"error": str(e)[:512]})
+        raise e
+    finally:
+        db.close()
+
+
+@celery_app.task(name="api.tasks.analyze_slice", bind=True, autoretry_for=(Exception,),
+                 dont_autoretry_for=(SoftTimeLimitExceeded,), retry_backoff=True, max_retries=3,
+                 time_limit=settings.slice_time_limit_s, soft_time_limit=int(settings.slice_time_limit_s * 0.9))
+def analyze_slice(self, sm: dict, job_id: str, total: int):
+    """
+    Fan-out unit: analyze a single slice and report progress for its job
+    """
+    uploader = _artifact_uploader(job_id)
+    result = _analyze_slice(sm, uploader)
+    timer = metrics.StageTimer()
+    timer.merge(result["timings"])
+    _finish_uploads(uploader, [result], timer)
+    result["timings"] = timer.breakdown()
+    progress.push_slice(job_id, result)
+
+    # Progress = completed sub-tasks / total, mapped onto the 40..80 band (Redis only)
+    done = progress.incr_slices_done(job_id)
+    progress.set_progress(job_id, min(80, 40 + int(done / total * 40)), "Analyzing content")
+    return result
+
+
+@celery_app.task(name="api.tasks.finalize_briefing", bind=True)
+def finalize_briefing(self, results: list, job_id: str, local_path: str, slice_len: int = 45,
+                      media_hash: str | None = None, object_key: str | None = None):
+    """
+    Chord callback: aggregate fanned-out slice results and persist the briefing
+    """
+    db: Session = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise Exception(f"Job {job_id} not found")
+        results = sorted(results, key=lambda r: r["idx"])
+        timer = metrics.StageTimer()
+        timer.merge((job.timings or {}).get("stages", {}))
+        for r in results:
+            timer.merge(r.get("timings", {}))
+        briefing = _persist_briefing(db, job, results, local_path, slice_len, timer=timer, source_key=object_key)
+        _remember_briefing(media_hash, slice_len, briefing.id, results)
+        progress.reset_slices_done(job_id)
+        logger.info(f"Successfully processed job {job_id}, created briefing {briefing.id}")
+        return {
+            "ok": True,
+            "briefing_id": briefing.id,
+            "slices_processed": len(results),
+            "duration": int(briefing.duration_s),
+        }
+    finally:
+        workspace.remove(job_id)
+        db.close()
+
+
+@celery_app.task(name="api.tasks.mark_job_failed")
+def mark_job_failed(request, exc, traceback, job_id: str):
+    """
+    Chord error handler: a slice exhausted its retries or finalization failed
+    """
+    logger.error(f"Processing failed for job {job_id}: {exc}")
+    db: Session = SessionLocal()
+    try:
+        db.query(Job).filter(Job.id == job_id).update({"status": "FAILURE", "error": str(exc)[:512]})
+        db.commit()
+        progress.publish(job_id, "failed", {"error": str(exc)[:512]})
+    finally:
+        workspace.remove(job_id)
+        db.close()
+
+
+def _id_ranges(shards: int) -> list[tuple[str, str | None]]:
+    """Split the uuid4 briefing-id keyspace into `shards` contiguous [lo, hi) ranges."""
+    bounds = [f"{i * 0x10000 // shards:04x}" for i in range(shards)]
+    return list(zip(bounds, bounds[1:] + [None]))
+
+
+def _rescore_chunk(db: Session, version: str, briefings: list) -> int:
+    """
+    Recompute text metrics for a batch of briefings (each a (briefing_id,
+    slice_len, slice rows) tuple) and write slices + briefings back in bulk.
+    Delivery metrics depend on the audio and are kept as stored.
+    """
+    rows = [r for _bid, _sl, slices in briefings for r in slices]
+    texts = [r.transcript or "" for r in rows]
+    contents = score_content_batch(texts)
+    impacts = score_impact_batch(texts, contents, [r.metrics["delivery"] for r in rows])
+    slice_updates, results = [], {}
+    for r, text, content, impact in zip(rows, texts, contents, impacts):
+        metrics = {**r.metrics, "content": content, "impact": impact}
+        risk_tags = sorted(set(detect_risks(text) + detect_media_risks(text)))
+        slice_updates.append({"id": r.id, "metrics": metrics, "risk_tags": risk_tags})
+        results.setdefault(r.briefing_id, []).append(
+            {"t_start": r.t_start, "t_end": r.t_end, "metrics": metrics, "risk_tags": risk_tags})
+
+    briefing_updates = []
+    for bid, slice_len, _slices in briefings:
+        res = results.get(bid, [])
+        agg = aggregate_briefing(res, slice_len_s=slice_len)
+        briefing_updates.append({
+            "id": bid,
+            "scores": agg["scores"],
+            "highlights": agg["highlights"],
+            "volatility": agg["volatility"],
+            "composite": agg["scores"]["composite"],
+            "risk_tags": sorted({t for r in res for t in r["risk_tags"]}),
+            "scoring_version": version,
+        })
+    if slice_updates:
+        db.execute(update(Slice), slice_updates)
+    db.execute(update(Briefing), briefing_updates)
+    db.commit()
+    response_cache.invalidate(b["id"] for b in briefing_updates)
+    return len(rows)
+
+
+@celery_app.task(name="api.tasks.rescore_range", bind=True)
+def rescore_range(self, lo: str | None = None, hi: str | None = None, chunk: int = 1000):
+    """
+    Re-score stored transcripts for briefings with id in [lo, hi) whose
+    scoring_version is stale. Slices are streamed with a server-side cursor and
+    written back one chunk (one transaction) at a time, so an interrupted run
+    resumes where it stopped.
+    """
+    version = cache.scoring_version()
+    stmt = (
+        select(Slice.id, Slice.briefing_id, Slice.t_start, Slice.t_end, Slice.transcript, Slice.metrics,
+               Briefing.slice_len_s)
+        .join(Briefing, Slice.briefing_id == Briefing.id)
+        .where(or_(Briefing.scoring_version.is_(None), Briefing.scoring_version != version))
+        .order_by(Slice.briefing_id, Slice.t_start)
+    )
+    if lo:
+        stmt = stmt.where(Briefing.id >= lo)
+    if hi:
+        stmt = stmt.where(Briefing.id < hi)
+
+    reader: Session = SessionLocal()
+    writer: Session = SessionLocal()
+    n_briefings = n_slices = 0
+    try:
+        rows = reader.execute(stmt.execution_options(yield_per=chunk))
+        if reader.get_bind().dialect.name != "postgresql":
+            rows = rows.all()  # no server-side cursors; an open read would block the writer (SQLite)
+        pending, pending_slices = [], 0
+        for bid, group in groupby(rows, key=lambda r: r.briefing_id):
+            slices = list(group)
+            pending.append((bid, slices[0].slice_len_s, slices))
+            pending_slices += len(slices)
+            if pending_slices >= chunk:
+                n_slices += _rescore_chunk(writer, version, pending)
+                n_briefings += len(pending)
+                pending, pending_slices = [], 0
+        if pending:
+            n_slices += _rescore_chunk(writer, version, pending)
+            n_briefings += len(pending)
+    finally:
+        reader.close()
+        writer.close()
+    logger.info(f"Rescored {n_briefings} briefings / {n_slices} slices in [{lo}, {hi}) to {version}")
+    return {"ok": True, "briefings": n_briefings, "slices": n_slices, "scoring_version": version}
+
+
+@celery_app.task(name="api.tasks.rescore")
+def rescore(shards: int = 16, chunk: int = 1000):
+    """
+    Fan a full archive rescore out across workers by briefing-id range
+    """
+    ranges = _id_ranges(shards)
+    group(rescore_range.s(lo, hi, chunk) for lo, hi in ranges).apply_async()
+    return {"ok": True, "shards": len(ranges)}
 
 
 def _mock_processing(self, job_id: str, local_path: str, db: Session):
@@ -0,0 +1,137 @@
+import fcntl, logging, os, shutil, time
+from contextlib import contextmanager
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-job scratch directories under WORKSPACE_ROOT (the volume shared by the
+# downloader and analysis workers). Each job records the bytes it expects to
+# need in <dir>/.reserved; admission sums those under a file lock so jobs on
+# every worker sharing the volume stay within WORKSPACE_BUDGET_MB together.
+RESERVED = ".reserved"
+_MB = 1 << 20
+DEFAULT_RESERVE = 1 << 30  # source size unknown up front (no Content-Length)
+
+
+class DiskBudgetExceeded(Exception):
+    pass
+
+
+@contextmanager
+def _locked():
+    os.makedirs(settings.workspace_root, exist_ok=True)
+    with open(os.path.join(settings.workspace_root, ".lock"), "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read_reserved(path: str) -> int:
+    try:
+        with open(os.path.join(path, RESERVED)) as f:
+            return int(f.read() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def reserved_bytes() -> int:
+    root = settings.workspace_root
+    if not os.path.isdir(root):
+        return 0
+    return sum(_read_reserved(e.path) for e in os.scandir(root) if e.is_dir())
+
+
+class Workspace:
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.path = os.path.join(settings.workspace_root, job_id)
+
+    def file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def audio_dir(self, nbytes: int) -> str:
+        """
+        Directory for slice WAVs / the shared PCM buffer: RAM-backed
+        WORKSPACE_AUDIO_ROOT when it has room for `nbytes`, else the job dir.
+        With fan-out the slices may be analyzed on another node, so audio
+        always stays in the (shared) job dir.
+        """
+        root = settings.workspace_audio_root
+        if root and not settings.pipeline_fanout:
+            try:
+                os.makedirs(root, exist_ok=True)
+                if shutil.disk_usage(root).free >= nbytes * 5 // 4:  # 25% headroom
+                    path = os.path.join(root, self.job_id)
+                    os.makedirs(path, exist_ok=True)
+                    return path
+            except OSError as e:
+                logger.warning(f"Audio scratch {root} unusable ({e}); using disk")
+        return self.path
+
+    def resize(self, nbytes: int):
+        with open(self.file(RESERVED), "w") as f:
+            f.write(str(int(nbytes)))
+
+    def remove(self):
+        remove(self.job_id)
+
+
+def reserve_for(source_bytes: int | None) -> int:
+    """Scratch estimate: the source, its stream-copied slices, slice audio and thumbnails."""
+    return int(source_bytes * settings.workspace_reserve_factor) if source_bytes else DEFAULT_RESERVE
+
+
+def create(job_id: str, reserve_bytes: int) -> Workspace:
+    """
+    Admit a job: reserve `reserve_bytes` against the budget and make its
+    directory. Raises DiskBudgetExceeded when the budget or free disk space
+    can't cover it (callers retry later).
+    """
+    ws = Workspace(job_id)
+    with _locked():
+        in_use = reserved_bytes() - _read_reserved(ws.path)
+        budget = settings.workspace_budget_mb * _MB
+        # A job larger than the whole budget is still admitted once nothing else is running
+        if budget and in_use and in_use + reserve_bytes > budget:
+            raise DiskBudgetExceeded(f"{(in_use + reserve_bytes) // _MB} MB needed, budget {budget // _MB} MB")
+        free = shutil.disk_usage(settings.workspace_root).free
+        if free - reserve_bytes < settings.workspace_min_free_mb * _MB:
+            raise DiskBudgetExceeded(f"{free // _MB} MB free, {reserve_bytes // _MB} MB needed")
+        os.makedirs(ws.path, exist_ok=True)
+        ws.resize(reserve_bytes)
+    return ws
+
+
+def get(job_id: str) -> Workspace:
+    """Workspace of an admitted job (created without a reservation if missing)."""
+    ws = Workspace(job_id)
+    os.makedirs(ws.path, exist_ok=True)
+    return ws
+
+
+def remove(job_id: str):
+    for root in (settings.workspace_root, settings.workspace_audio_root):
+        if root:
+            shutil.rmtree(os.path.join(root, job_id), ignore_errors=True)
+
+
+def sweep(max_age_s: float) -> int:
+    """Remove workspaces (and stray files) untouched for `max_age_s`, e.g. left by a killed worker."""
+    cutoff, n = time.time() - max_age_s, 0
+    for root in (settings.workspace_root, settings.workspace_audio_root):
+        if not root or not os.path.isdir(root):
+            continue
+        for e in os.scandir(root):
+            try:
+                if e.name == ".lock" or e.stat().st_mtime > cutoff:
+                    continue
+                if e.is_dir():
+                    shutil.rmtree(e.path, ignore_errors=True)
+                else:
+                    os.remove(e.path)
+                n += 1
+            except OSError:
+                pass
+    return n
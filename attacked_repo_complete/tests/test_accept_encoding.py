@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+import pytest
+
+for mod in ("fastapi", "celery", "sqlalchemy", "boto3", "redis", "orjson"):
+    pytest.importorskip(mod)
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "services"))
+from api.api_routes import _accepts_gzip  # noqa: E402
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip", True),
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, gzip;q=0.8", True),
+    ("*", True),
+    ("identity, *;q=0.5", True),
+    ("", False),
+    ("identity", False),
+    ("gzip;q=0", False),
+    ("gzip;q=0.000", False),
+    ("*;q=0", False),
+    ("gzip;q=0, *", False),
+    ("*, gzip;q=0", False),
+    ("x-gzip", True),
+    ("nogzip", False),
+    ("GZIP; Q=0.5", True),
+    ("gzip;q=bogus", False),
+])
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(header) is expected
@@ -0,0 +1,38 @@
+import json, os, subprocess, sys
+from pathlib import Path
+import pytest
+
+for mod in ("fastapi", "celery", "sqlalchemy", "boto3", "redis", "orjson", "prometheus_client"):
+    pytest.importorskip(mod)
+
+ROOT = Path(__file__).resolve().parents[1]
+# The API only enqueues by task name; none of the analyzer/ML stack may load
+HEAVY = ("analyzer", "api.tasks", "librosa", "vosk", "cv2", "numpy", "scipy", "numba", "soundfile")
+MAX_IMPORT_S = float(os.getenv("API_IMPORT_MAX_S", "4.0"))
+MAX_RSS_MB = float(os.getenv("API_IMPORT_MAX_RSS_MB", "140"))
+
+# Peak RSS from VmHWM: ru_maxrss would include the forking pytest process's own peak
+PROBE = """
+import json, re, sys
+import api.app
+rss_kb = int(re.search(r"VmHWM:\\s+(\\d+)", open("/proc/self/status").read()).group(1))
+print(json.dumps({"modules": sorted(sys.modules), "rss_mb": rss_kb / 1024}))
+"""
+
+def _cumulative_s(importtime_log: str, module: str) -> float:
+    # "import time: self [us] | cumulative | imported package"
+    for line in importtime_log.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1e6
+    raise AssertionError(f"{module} not in -X importtime output")
+
+def test_api_startup_skips_analyzer_stack(tmp_path):
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "services"), "DATABASE_URL": f"sqlite:///{tmp_path}/api.db"}
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+    out = json.loads(proc.stdout.strip().splitlines()[-1])
+    loaded = [m for m in out["modules"] if m.split(".")[0] in HEAVY or m in HEAVY]
+    assert not loaded, f"API import pulled in worker-only modules: {loaded[:10]}"
+    assert _cumulative_s(proc.stderr, "api.app") < MAX_IMPORT_S
+    assert out["rss_mb"] < MAX_RSS_MB
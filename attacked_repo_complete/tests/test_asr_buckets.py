@@ -0,0 +1,8 @@
+from services.analyzer.asr import bucket_words
+
+def test_bucket_words_keeps_boundary_words():
+    slices = [{"t_start":0,"t_end":45},{"t_start":45,"t_end":90}]
+    words = [{"word":"we","start":44.8,"end":45.2},{"word":"will","start":45.3,"end":45.6}]
+    b = bucket_words(words, slices)
+    assert [w["word"] for w in b[0]] == ["we"]
+    assert [w["word"] for w in b[1]] == ["will"]
@@ -0,0 +1,28 @@
+import random
+from services.analyzer.nlp_metrics import score_content, score_content_batch, fkgl, fkgl_batch
+from services.analyzer.impact_metrics import score_impact, score_impact_batch
+
+VOCAB = ("we believe", "leverage", "synergy", "some", "vendor", "is not", "we take full responsibility",
+         "no comment", "quote", "tbd", "by Monday", "tomorrow", "the", "outage", "was", "contained",
+         "customers", "can’t", "extraordinarily", "data", "secure", "on 2024-05-01")
+
+def _texts(n=200):
+    rnd = random.Random(7)
+    out = [""]
+    for _ in range(n):
+        sents = [" ".join(rnd.choice(VOCAB) for _ in range(rnd.randint(1, 12))) + rnd.choice(".!?")
+                 for _ in range(rnd.randint(1, 4))]
+        out.append(" ".join(sents))
+    return out
+
+def test_content_batch_parity():
+    texts = _texts()
+    assert list(fkgl_batch(texts)) == [fkgl(t) for t in texts]
+    assert score_content_batch(texts) == [score_content(t) for t in texts]
+
+def test_impact_batch_parity():
+    texts = _texts()
+    contents = [score_content(t) for t in texts]
+    deliveries = [{"tone": (i % 11) / 2} for i in range(len(texts))]
+    expected = [score_impact(t, c, d) for t, c, d in zip(texts, contents, deliveries)]
+    assert score_impact_batch(texts, contents, deliveries) == expected
@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic_settings")
+from services.api.db import async_url, pool_options
+from services.api.config import settings
+
+def test_async_url_swaps_driver_only():
+    assert async_url("postgresql+psycopg2://u:p%40ss@db:5432/attacked") == "postgresql+asyncpg://u:p%40ss@db:5432/attacked"
+    assert async_url("sqlite:////tmp/a.db") == "sqlite+aiosqlite:////tmp/a.db"
+    with pytest.raises(ValueError):
+        async_url("mysql://u@h/db")
+
+def test_pool_options():
+    assert pool_options("sqlite:////tmp/a.db") == {}
+    opts = pool_options("postgresql://u@db/attacked")
+    assert opts["pool_size"] == settings.db_pool_size and opts["pool_pre_ping"] is settings.db_pool_pre_ping
+
+def test_backfill_fills_list_filter_columns(tmp_path, monkeypatch):
+    from sqlalchemy import create_engine, insert, select
+    from services.api import db, models
+    engine = create_engine(f"sqlite:///{tmp_path}/b.db")
+    models.Base.metadata.create_all(engine)
+    monkeypatch.setattr(db, "engine", engine)
+    B, S = models.Briefing, models.Slice
+    row = {"video_src": "v", "duration_s": 90, "slice_len_s": 45, "highlights": [], "volatility": {}}
+    with engine.begin() as conn:
+        # Row from before the columns existed (left out of the INSERT: SQL NULL, not JSON null)
+        conn.execute(insert(B).values(**row, id="old", scores={"composite": 0.4}))
+        conn.execute(insert(B).values(**row, id="new", scores={"composite": 0.9}, composite=0.9, risk_tags=["x"]))
+        conn.execute(insert(S), [{"briefing_id": "old", "t_start": i, "t_end": i + 1, "transcript": "", "metrics": {},
+                                  "risk_tags": tags, "thumbnails": [], "au": {}}
+                                 for i, tags in enumerate((["b", "a"], ["a"], []))])
+    assert db.backfill_briefings(batch=1) == 1
+    assert db.backfill_briefings() == 0
+    with engine.connect() as conn:
+        got = dict((r.id, (r.composite, r.risk_tags)) for r in conn.execute(select(B.id, B.composite, B.risk_tags)))
+    assert got == {"old": (0.4, ["a", "b"]), "new": (0.9, ["x"])}
@@ -0,0 +1,26 @@
+import numpy as np
+import librosa
+from services.analyzer.delivery_metrics import frame_features, speaking_rate
+
+SR = 16000
+
+def _tone(f0, seconds):
+    t = np.arange(int(SR * seconds)) / SR
+    return (0.1 * np.sin(2 * np.pi * np.cumsum(np.broadcast_to(f0, t.shape)) / SR)).astype(np.float32)
+
+def test_rms_matches_librosa():
+    y = (np.random.default_rng(1).standard_normal(SR * 3) * 0.05).astype(np.float32)
+    assert np.isclose(frame_features(y)["rms"], librosa.feature.rms(y=y).mean(), rtol=1e-6)
+
+def test_pauses_and_pitch():
+    y = np.concatenate([_tone(150.0, 2), np.zeros(SR, dtype=np.float32), _tone(150.0, 1)])
+    f = frame_features(y)
+    assert abs(f["pause_ratio"] - 0.25) < 0.05
+    assert f["voiced_ratio"] > 0.6
+    assert f["pitch_var_st"] < 0.5  # steady tone
+    glide = frame_features(_tone(np.linspace(100, 200, SR * 3), 3))
+    assert glide["pitch_var_st"] > 2  # one octave sweep
+
+def test_speaking_rate_excludes_pauses():
+    r = speaking_rate({"duration_s": 10.0, "pause_ratio": 0.5}, "word " * 20)
+    assert r == {"wps": 2.0, "articulation_rate": 4.0}
@@ -0,0 +1,37 @@
+import random
+import numpy as np
+import pytest
+from services.analyzer.aggregation import BriefingAggregator, aggregate_briefing
+
+TAGS = ["vendor_blame", "weasel_words", "risky_quote", "media_sensitive"]
+
+def _results(n, seed=3):
+    rnd = random.Random(seed)
+    metric = lambda keys: {k: round(rnd.uniform(0, 5), 2) for k in keys}
+    return [{
+        "t_start": i*45, "t_end": (i+1)*45,
+        "metrics": {
+            "content": metric(("clarity", "transparency", "consistency", "accountability", "jargon_ratio")),
+            "delivery": metric(("tone", "nonverbal", "language_precision")),
+            "impact": metric(("trust_proj", "media_sensitivity", "future_proof")),
+        },
+        "risk_tags": rnd.sample(TAGS, rnd.randint(0, 3)),
+    } for i in range(n)]
+
+def test_matches_batch_statistics():
+    results = _results(500)
+    out = aggregate_briefing(results, 45)
+    for layer in ("content", "delivery", "impact"):
+        vals = [np.mean(list(r["metrics"][layer].values())) for r in results]
+        assert out["scores"][layer] == pytest.approx(np.mean(vals), abs=0.006)
+        assert out["volatility"][layer] == pytest.approx(np.std(vals), abs=0.006)
+    ranked = sorted(results, key=lambda r: len(r["risk_tags"]), reverse=True)[:3]
+    assert [(h["t_start"], h["risk_tags"]) for h in out["highlights"]] == [(r["t_start"], r["risk_tags"]) for r in ranked]
+    assert out["duration_s"] == results[-1]["t_end"]
+
+def test_snapshot_midway():
+    results = _results(20)
+    agg = BriefingAggregator().extend(results[:10])
+    assert agg.snapshot()["scores"] == aggregate_briefing(results[:10], 45)["scores"]
+    agg.extend(results[10:])
+    assert agg.snapshot() == aggregate_briefing(results, 45)
@@ -0,0 +1,17 @@
+from services.analyzer.lexicon import LexiconEngine, scan
+from services.analyzer.nlp_metrics import hedge_ratio, detect_risks
+
+def test_multiword_hedges_match():
+    words = "We believe the outage is contained".split()
+    assert hedge_ratio(words) > 0
+
+def test_word_boundaries_and_apostrophes():
+    hits = scan("Something awesome happened; we can't disclose more.")
+    assert "WEASEL" not in hits
+    assert "risky_quote" in detect_risks("We can't disclose that.")
+
+def test_engine_scales_to_large_lexicons():
+    phrases = {f"term {i} phrase" for i in range(5000)}
+    eng = LexiconEngine({"BIG": phrases, "X": {"term 42"}})
+    hits = eng.scan("the term 42 phrase and term 4999 phrase again")
+    assert hits["BIG"] == 2 and hits["X"] == 1 and hits.n_words == 9
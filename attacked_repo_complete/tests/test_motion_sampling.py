@@ -0,0 +1,17 @@
+import cv2
+import numpy as np
+from services.analyzer.delivery_metrics import estimate_nonverbal
+
+def test_sampled_motion_tracks_full(tmp_path):
+    # Textured frame panning 2 px per frame: every adjacent diff is about the same
+    path = str(tmp_path / "pan.avi")
+    rng = np.random.default_rng(42)
+    tex = cv2.GaussianBlur(rng.integers(0, 255, (240, 400), dtype=np.uint8), (7, 7), 0)
+    vw = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, (320, 240))
+    for i in range(60):
+        vw.write(cv2.cvtColor(np.ascontiguousarray(tex[:, i:i + 320]), cv2.COLOR_GRAY2BGR))
+    vw.release()
+    full = estimate_nonverbal(path)["motion"]
+    sampled = estimate_nonverbal(path, sample_fps=5)["motion"]
+    assert full > 0
+    assert abs(sampled - full) / full < 0.08
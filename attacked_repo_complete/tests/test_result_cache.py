@@ -0,0 +1,81 @@
+import sys, uuid
+from pathlib import Path
+import pytest
+
+for mod in ("fakeredis", "celery", "sqlalchemy", "vosk", "cv2", "librosa", "soundfile"):
+    pytest.importorskip(mod)
+import fakeredis
+import numpy as np
+import soundfile as sf
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "services"))
+from api import cache, models, progress, tasks  # noqa: E402
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """process_briefing on SQLite + fakeredis with media prep stubbed to one real wav slice."""
+    engine = create_engine(f"sqlite:///{tmp_path}/t.db")
+    models.Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    r = fakeredis.FakeRedis()
+    for mod in (cache, progress):
+        monkeypatch.setattr(mod, "_redis", r)
+    monkeypatch.setattr(tasks, "SessionLocal", Session)
+    for name, value in (("result_cache", True), ("upload_artifacts", False), ("pipeline_fanout", False),
+                        ("shared_audio", False), ("workspace_root", str(tmp_path / "ws"))):
+        monkeypatch.setattr(tasks.settings, name, value)
+    monkeypatch.setattr(tasks.process_briefing, "update_state", lambda *a, **k: None)
+
+    wav = str(tmp_path / "slice.wav")
+    t = np.arange(16000 * 3) / 16000
+    sf.write(wav, (0.1 * np.sin(2 * np.pi * 150 * t)).astype(np.float32), 16000)
+    sm = {"idx": 0, "t_start": 0, "t_end": 3, "video_path": wav}
+    monkeypatch.setattr(tasks, "slice_video", lambda *a, **k: [dict(sm)])
+    monkeypatch.setattr(tasks, "prepare_slice", lambda *a, **k: (wav, []))
+    monkeypatch.setattr(tasks, "estimate_nonverbal", lambda *a, **k: {})
+    monkeypatch.setattr(tasks, "decode_audio", lambda *a, **k: wav)
+    monkeypatch.setattr(tasks, "load_pcm", lambda *a, **k: b"")
+
+    def run():
+        job_id = str(uuid.uuid4())
+        db = Session(); db.add(models.Job(id=job_id, status="PENDING", progress=0)); db.commit(); db.close()
+        out = tasks.process_briefing.apply(args=[wav, None, 45], kwargs={"media_hash": "m1", "duration_s": 3},
+                                           task_id=job_id).get()
+        db = Session(); transcripts = [s.transcript for s in db.query(models.Slice).filter_by(briefing_id=out["briefing_id"])]
+        db.close()
+        return out, transcripts
+    return run, r, monkeypatch
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_failed_asr_is_not_cached(pipeline, streaming):
+    run, r, monkeypatch = pipeline
+    monkeypatch.setattr(tasks.settings, "streaming_asr", streaming)
+
+    def broken(*_a, **_k):
+        raise RuntimeError("Vosk model not found")
+    monkeypatch.setattr(tasks, "asr_transcribe", broken)
+    monkeypatch.setattr(tasks, "transcribe_stream", broken)
+    first, transcripts = run()
+    assert transcripts == [""]
+    assert not r.keys("attacked:cache:briefing:*") and not r.keys("attacked:cache:slice:*")
+
+    monkeypatch.setattr(tasks, "asr_transcribe", lambda *_a, **_k: ("hello world", []))
+    monkeypatch.setattr(tasks, "transcribe_stream", lambda *_a, **_k: [{"word": "hello", "start": 0.5},
+                                                                        {"word": "world", "start": 1.0}])
+    second, transcripts = run()  # same media: re-analyzed, not the empty briefing
+    assert not second.get("cached") and second["briefing_id"] != first["briefing_id"]
+    assert transcripts == ["hello world"]
+    third, _ = run()
+    assert third["cached"] and third["briefing_id"] == second["briefing_id"]
+
+
+@pytest.mark.parametrize("flag", ["streaming_asr", "single_pass_segmenter", "shared_audio"])
+def test_fingerprint_tracks_pipeline_flags(monkeypatch, flag):
+    monkeypatch.setattr(cache.settings, flag, False)
+    before = cache.fingerprint(45)
+    monkeypatch.setattr(cache.settings, flag, True)
+    assert cache.fingerprint(45) != before
@@ -0,0 +1,26 @@
+import shutil, subprocess
+import pytest
+import soundfile as sf
+from services.analyzer.media_prep import probe_duration, segment_video
+
+pytestmark = pytest.mark.skipif(not (shutil.which("ffmpeg") and shutil.which("ffprobe")), reason="ffmpeg not installed")
+
+def _clip(path, audio=True):
+    # 7 s at 10 fps with a keyframe every 13 frames: keyframes at 0, 1.3, 2.6, 3.9, 5.2, 6.5 s
+    cmd = ["ffmpeg", "-v", "error", "-y", "-f", "lavfi", "-i", "testsrc=size=160x120:rate=10"]
+    if audio:
+        cmd += ["-f", "lavfi", "-i", "sine=frequency=300:sample_rate=44100", "-c:a", "aac"]
+    subprocess.run(cmd + ["-t", "7", "-c:v", "mpeg4", "-g", "13", str(path)], check=True)
+    return str(path)
+
+@pytest.mark.parametrize("audio", [True, False])
+def test_segments_cut_at_keyframes_and_line_up(tmp_path, audio):
+    slices = segment_video(_clip(tmp_path / "in.mp4", audio), slice_len=2, work_dir=str(tmp_path))
+    # First keyframe at or after 2, 4 and 6 s
+    assert [s["t_start"] for s in slices] == [0, 2.6, 5.2, 6.5]
+    assert [s["t_end"] for s in slices] == pytest.approx([2.6, 5.2, 6.5, 7], abs=0.05)
+    for s in slices:
+        length = s["t_end"] - s["t_start"]
+        assert abs(probe_duration(s["video_path"]) - length) < 0.05
+        assert abs(sf.info(s["wav_path"]).duration - length) < 0.05
+        assert len(s["thumbnails"]) == 1
@@ -0,0 +1,17 @@
+import numpy as np
+import soundfile as sf
+from services.analyzer.delivery_metrics import score_delivery, score_delivery_pcm
+from services.analyzer.media_prep import load_pcm, slice_pcm
+
+def test_pcm_slice_matches_wav(tmp_path):
+    sr = 16000
+    rng = np.random.default_rng(42)
+    pcm = (rng.standard_normal(sr * 4) * 3000).astype(np.int16)
+    raw = tmp_path / "audio.pcm"
+    pcm.tofile(raw)
+    view = slice_pcm(load_pcm(str(raw)), 1, 3)
+    assert len(view) == 2 * sr
+    wav = tmp_path / "sl.wav"
+    sf.write(wav, pcm[sr:3 * sr], sr, subtype="PCM_16")
+    text = "We will publish the report tomorrow. We take full responsibility."
+    assert score_delivery_pcm(view, text) == score_delivery(str(wav), text)
@@ -7,29 +7,46 @@ class APIError extends Error {
   }
 }
 
-async function apiRequest<T>(endpoint: string, options: RequestInit = {}): Promise<T> {
+async function apiResponse(endpoint: string, options: RequestInit = {}): Promise<Response> {
+  let response: Response;
   try {
-    const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+    response = await fetch(`${API_BASE_URL}${endpoint}`, {
       ...options,
       headers: {
         'Accept': 'application/json',
         ...options.headers,
       },
     });
+  } catch (error) {
+    throw new APIError(`Network error: ${error instanceof Error ? error.message : 'Unknown error'}`);
+  }
 
-    if (!response.ok) {
-      throw new APIError(`API request failed: ${response.statusText}`, response.status);
-    }
+  if (!response.ok) {
+    throw new APIError(`API request failed: ${response.statusText}`, response.status);
+  }
+  return response;
+}
 
+async function apiRequest<T>(endpoint: string, options: RequestInit = {}): Promise<T> {
+  const response = await apiResponse(endpoint, options);
+  try {
     return await response.json();
   } catch (error) {
-    if (error instanceof APIError) {
-      throw error;
-    }
-    throw new APIError(`Network error: ${error instanceof Error ? error.message : 'Unknown error'}`);
+    throw new APIError(`Invalid response: ${error instanceof Error ? error.message : 'Unknown error'}`, response.status);
   }
 }
 
+function briefingQuery(params: import('../types/api').BriefingListParams): string {
+  const query = new URLSearchParams();
+  Object.entries(params).forEach(([key, value]) => {
+    if (value === undefined || value === null || value === '') return;
+    if (Array.isArray(value)) value.forEach((v) => query.append(key, String(v)));
+    else query.append(key, String(value));
+  });
+  const qs = query.toString();
+  return `/v1/briefings${qs ? `?${qs}` : ''}`;
+}
+
 export const apiClient = {
   async getHealth(): Promise<import('../types/api').HealthResponse> {
     return apiRequest('/v1/health');
@@ -55,8 +72,18 @@ export const apiClient = {
     return apiRequest(`/v1/jobs/${jobId}`);
   },
 
-  async listBriefings(): Promise<import('../types/api').BriefingListItem[]> {
-    return apiRequest('/v1/briefings');
+  jobEventsUrl(jobId: string): string {
+    return `${API_BASE_URL}/v1/jobs/${jobId}/events`;
+  },
+
+  async listBriefings(params: import('../types/api').BriefingListParams = {}): Promise<import('../types/api').BriefingListItem[]> {
+    return apiRequest(briefingQuery(params));
+  },
+
+  async listBriefingsPage(params: import('../types/api').BriefingListParams = {}): Promise<import('../types/api').BriefingPage> {
+    const response = await apiResponse(briefingQuery(params));
+    const items = await response.json();
+    return { items, nextCursor: response.headers.get('X-Next-Cursor') };
   },
 
   async getBriefing(id: string): Promise<import('../types/api').BriefingSummary> {
@@ -66,4 +93,12 @@ export const apiClient = {
   async getSlices(briefingId: string): Promise<import('../types/api').SliceRow[]> {
     return apiRequest(`/v1/briefings/${briefingId}/slices`);
   },
+
+  async searchTranscripts(q: string, opts: { briefingId?: string; limit?: number; offset?: number } = {}): Promise<import('../types/api').SearchResults> {
+    const query = new URLSearchParams({ q });
+    if (opts.briefingId) query.append('briefing_id', opts.briefingId);
+    if (opts.limit) query.append('limit', String(opts.limit));
+    if (opts.offset) query.append('offset', String(opts.offset));
+    return apiRequest(`/v1/search?${query.toString()}`);
+  },
 };
@@ -1,14 +1,25 @@
 import { useState, useEffect, useRef } from 'react';
 import { apiClient } from '../api/client';
-import type { JobStatus } from '../types/api';
+import type { JobStatus, LiveSlice, PartialAggregate } from '../types/api';
 
+const isTerminal = (s: JobStatus) => s.status === 'SUCCESS' || s.status === 'FAILURE';
+
+/**
+ * Live job status. Subscribes to the job's Server-Sent Events stream
+ * (progress, per-slice results, partial scores); falls back to interval
+ * polling when EventSource is unavailable or the stream cannot be opened.
+ */
 export function useJobPolling(jobId: string | null, intervalMs: number = 3000) {
   const [jobStatus, setJobStatus] = useState<JobStatus | null>(null);
+  const [slices, setSlices] = useState<LiveSlice[]>([]);
+  const [partial, setPartial] = useState<PartialAggregate | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [isPolling, setIsPolling] = useState(false);
   const intervalRef = useRef<NodeJS.Timeout>();
 
   useEffect(() => {
+    setSlices([]);
+    setPartial(null);
     if (!jobId) {
       setJobStatus(null);
       setError(null);
@@ -18,39 +29,82 @@ export function useJobPolling(jobId: string | null, intervalMs: number = 3000) {
 
     setIsPolling(true);
     setError(null);
+    let source: EventSource | null = null;
+    let closed = false;
+
+    const stop = () => {
+      closed = true;
+      setIsPolling(false);
+      source?.close();
+      if (intervalRef.current) {
+        clearInterval(intervalRef.current);
+      }
+    };
 
     const poll = async () => {
       try {
         const status = await apiClient.getJobStatus(jobId);
         setJobStatus(status);
-        
-        if (status.status === 'SUCCESS' || status.status === 'FAILURE') {
-          setIsPolling(false);
-          if (intervalRef.current) {
-            clearInterval(intervalRef.current);
-          }
+        if (isTerminal(status)) {
+          stop();
         }
       } catch (err) {
         setError(err instanceof Error ? err.message : 'Polling failed');
-        setIsPolling(false);
-        if (intervalRef.current) {
-          clearInterval(intervalRef.current);
-        }
+        stop();
       }
     };
 
-    // Initial poll
-    poll();
+    const startPolling = () => {
+      poll();
+      intervalRef.current = setInterval(poll, intervalMs);
+    };
 
-    // Set up interval
-    intervalRef.current = setInterval(poll, intervalMs);
+    if (typeof EventSource === 'undefined') {
+      startPolling();
+      return stop;
+    }
 
-    return () => {
-      if (intervalRef.current) {
-        clearInterval(intervalRef.current);
+    source = new EventSource(apiClient.jobEventsUrl(jobId));
+    const on = (event: string, handler: (data: any) => void) =>
+      source!.addEventListener(event, (e) => handler(JSON.parse((e as MessageEvent).data)));
+
+    on('status', (status: JobStatus) => {
+      setJobStatus(status);
+      if (isTerminal(status)) {
+        stop();
+      }
+    });
+    on('progress', ({ progress }) => {
+      setJobStatus((s) => (s ? { ...s, status: 'PROCESSING', progress } : s));
+    });
+    on('download', ({ bytes_downloaded, bytes_total }) => {
+      setJobStatus((s) => (s ? { ...s, status: 'DOWNLOADING', bytes_downloaded, bytes_total } : s));
+    });
+    on('slice', ({ partial: agg, ...slice }: LiveSlice) => {
+      // Slices can repeat around the server's replay boundary; keep one per idx
+      setSlices((prev) => [...prev.filter((s) => s.idx !== slice.idx), slice].sort((a, b) => a.idx - b.idx));
+      if (agg) {
+        setPartial(agg);
+      }
+    });
+    on('done', ({ briefing_id }) => {
+      setJobStatus((s) => (s ? { ...s, status: 'SUCCESS', progress: 100, briefing_id } : s));
+      stop();
+    });
+    on('failed', ({ error: message }) => {
+      setJobStatus((s) => (s ? { ...s, status: 'FAILURE', error: message } : s));
+      stop();
+    });
+    source.onerror = () => {
+      // EventSource retries on its own after a dropped connection; if it gave up, poll instead
+      if (!closed && source?.readyState === EventSource.CLOSED) {
+        source = null;
+        startPolling();
       }
     };
+
+    return stop;
   }, [jobId, intervalMs]);
 
-  return { jobStatus, error, isPolling };
-}
\ No newline at end of file
+  return { jobStatus, slices, partial, error, isPolling };
+}
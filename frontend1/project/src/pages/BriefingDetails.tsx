@@ -192,7 +192,13 @@ export function BriefingDetails() {
           <div>
             <p className="text-gray-500 dark:text-gray-400">Video Source</p>
             <p className="font-medium text-gray-900 dark:text-white truncate" title={briefing.video_src}>
-              {briefing.video_src}
+              {briefing.source_url ? (
+                <a href={briefing.source_url} target="_blank" rel="noreferrer" className="text-blue-600 dark:text-blue-400 hover:underline">
+                  {briefing.video_src}
+                </a>
+              ) : (
+                briefing.video_src
+              )}
             </p>
           </div>
         </div>
@@ -1,62 +1,82 @@
-import { useState, useEffect, useMemo } from 'react';
+import { useState, useEffect, useMemo, useRef } from 'react';
 import { Link } from 'react-router-dom';
 import { Calendar, Filter, Search, ExternalLink } from 'lucide-react';
 import { apiClient } from '../api/client';
-import { BriefingListItem } from '../types/api';
+import { BriefingListItem, BriefingListParams } from '../types/api';
 import { ScoreBadge } from '../components/ScoreBadge';
 import { format } from 'date-fns';
 
+const PAGE_SIZE = 50;
+
 export function Briefings() {
   const [briefings, setBriefings] = useState<BriefingListItem[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [searchTerm, setSearchTerm] = useState('');
   const [dateRange, setDateRange] = useState({ start: '', end: '' });
   const [scoreRange, setScoreRange] = useState({ min: 0, max: 100 });
+  const [debouncedSearch, setDebouncedSearch] = useState('');
+  // Bumped per query so responses for superseded filters are dropped
+  const requestId = useRef(0);
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  // The slider works in displayed percent; send the inverse of toPercent below
+  const params = useMemo<BriefingListParams>(() => ({
+    limit: PAGE_SIZE,
+    search: debouncedSearch || undefined,
+    created_from: dateRange.start ? `${dateRange.start}T00:00:00` : undefined,
+    created_to: dateRange.end ? `${dateRange.end}T23:59:59.999999` : undefined,
+    min_score: scoreRange.min > 0 ? scoreRange.min * 5 : undefined,
+    max_score: scoreRange.max < 100 ? scoreRange.max * 5 : undefined,
+  }), [debouncedSearch, dateRange, scoreRange]);
+
+  const hasFilters = Boolean(debouncedSearch || dateRange.start || dateRange.end ||
+    scoreRange.min > 0 || scoreRange.max < 100);
 
   useEffect(() => {
+    const current = ++requestId.current;
     const loadBriefings = async () => {
       try {
-        const data = await apiClient.listBriefings();
-        setBriefings(data);
+        const page = await apiClient.listBriefingsPage(params);
+        if (current !== requestId.current) return;
+        setBriefings(page.items);
+        setNextCursor(page.nextCursor);
       } catch (error) {
         console.error('Failed to load briefings:', error);
       } finally {
-        setLoading(false);
+        if (current === requestId.current) setLoading(false);
       }
     };
 
     loadBriefings();
-  }, []);
+  }, [params]);
+
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    const current = requestId.current;
+    setLoadingMore(true);
+    try {
+      const page = await apiClient.listBriefingsPage({ ...params, cursor: nextCursor });
+      if (current !== requestId.current) return;
+      setBriefings(prev => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Failed to load more briefings:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const toPercent = (s?: number) => {
   const v = (s ?? 0) / 5;            // <-- divide by 5 (0–500 -> 0–100)
   return Math.max(0, Math.min(100, Math.round(v)));
 };
 
-  const filteredBriefings = useMemo(() => {
-    return briefings.filter((briefing) => {
-      // Search filter
-      if (searchTerm && !briefing.id.toLowerCase().includes(searchTerm.toLowerCase()) &&
-          !briefing.video_src.toLowerCase().includes(searchTerm.toLowerCase())) {
-        return false;
-      }
-
-      // Date range filter
-      if (dateRange.start || dateRange.end) {
-        const briefingDate = new Date(briefing.created_at);
-        if (dateRange.start && briefingDate < new Date(dateRange.start)) return false;
-        if (dateRange.end && briefingDate > new Date(dateRange.end)) return false;
-      }
-
-      // Score filter
-    const compositeScore = toPercent(briefing.scores.composite);
-      if (compositeScore < scoreRange.min || compositeScore > scoreRange.max) {
-        return false;
-      }
-
-      return true;
-    });
-  }, [briefings, searchTerm, dateRange, scoreRange]);
-
   if (loading) {
     return (
       <div className="p-6">
@@ -151,22 +171,22 @@ export function Briefings() {
         <div className="px-6 py-4 border-b border-gray-200 dark:border-gray-700">
           <div className="flex justify-between items-center">
             <h2 className="text-lg font-medium text-gray-900 dark:text-white">
-              Briefings ({filteredBriefings.length})
+              Briefings ({briefings.length}{nextCursor ? '+' : ''})
             </h2>
           </div>
         </div>
 
-        {filteredBriefings.length === 0 ? (
+        {briefings.length === 0 ? (
           <div className="p-12 text-center">
             <Calendar className="mx-auto h-12 w-12 text-gray-400" />
             <h3 className="mt-4 text-lg font-medium text-gray-900 dark:text-white">No briefings found</h3>
             <p className="mt-2 text-gray-500 dark:text-gray-400">
-              {briefings.length === 0 
+              {!hasFilters
                 ? "Upload your first video to get started!" 
                 : "Try adjusting your filters to see more results."
               }
             </p>
-            {briefings.length === 0 && (
+            {!hasFilters && (
               <Link
                 to="/upload"
                 className="mt-4 inline-flex items-center px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors"
@@ -177,7 +197,7 @@ export function Briefings() {
           </div>
         ) : (
           <div className="divide-y divide-gray-200 dark:divide-gray-700">
-            {filteredBriefings.map((briefing) => (
+            {briefings.map((briefing) => (
               <div key={briefing.id} className="p-6 hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors">
                 <div className="flex items-center justify-between">
                   <div className="flex-1 min-w-0">
@@ -234,6 +254,18 @@ export function Briefings() {
             ))}
           </div>
         )}
+
+        {nextCursor && (
+          <div className="px-6 py-4 border-t border-gray-200 dark:border-gray-700 text-center">
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -12,7 +12,27 @@ import {
   ExternalLink
 } from 'lucide-react';
 import { apiClient } from '../api/client';
-import { SliceRow } from '../types/api';
+import { SearchHit, SliceRow } from '../types/api';
+
+// Older briefings stored worker-local thumbnail paths; only presigned URLs are renderable
+const isUrl = (src: string) => /^https?:\/\//.test(src);
+
+// Search snippets are raw transcript text with <mark> around matches; escape
+// everything, then restore only the highlight tags before rendering as HTML
+const escapeHtml = (text: string) =>
+  text
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&#39;');
+
+const snippetHtml = (snippet: string) =>
+  escapeHtml(snippet).replace(/&lt;(\/?)mark&gt;/g, '<$1mark>');
+
+// /v1/search rejects queries shorter than this
+const MIN_SEARCH_LENGTH = 2;
+const SEARCH_PAGE_SIZE = 100;
 
 export function Slices() {
   const { id } = useParams<{ id: string }>();
@@ -23,6 +43,9 @@ export function Slices() {
   const [timeRange, setTimeRange] = useState({ start: '', end: '' });
   const [expandedSlices, setExpandedSlices] = useState<Set<string>>(new Set());
   const [showRawData, setShowRawData] = useState<string | null>(null);
+  const [searchHits, setSearchHits] = useState<Map<string, SearchHit> | null>(null);
+  const [searching, setSearching] = useState(false);
+  const [searchError, setSearchError] = useState<string | null>(null);
 
   useEffect(() => {
     if (!id) return;
@@ -43,10 +66,53 @@ export function Slices() {
     loadSlices();
   }, [id]);
 
+  useEffect(() => {
+    const term = searchTerm.trim();
+    if (!id || term.length < MIN_SEARCH_LENGTH) {
+      setSearchHits(null);
+      setSearchError(null);
+      setSearching(false);
+      return;
+    }
+
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      setSearching(true);
+      setSearchError(null);
+      try {
+        const hits = new Map<string, SearchHit>();
+        let offset: number | null | undefined = 0;
+        while (offset !== null && offset !== undefined) {
+          const page = await apiClient.searchTranscripts(term, {
+            briefingId: id,
+            limit: SEARCH_PAGE_SIZE,
+            offset,
+          });
+          if (cancelled) return;
+          page.hits.forEach((hit) => hits.set(hit.slice_id, hit));
+          offset = page.next_offset;
+        }
+        setSearchHits(hits);
+      } catch (err) {
+        if (!cancelled) {
+          setSearchError(err instanceof Error ? err.message : 'Search failed');
+          setSearchHits(new Map());
+        }
+      } finally {
+        if (!cancelled) setSearching(false);
+      }
+    }, 300);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [id, searchTerm]);
+
   const filteredSlices = useMemo(() => {
     return slices.filter((slice) => {
-      // Search filter
-      if (searchTerm && !slice.transcript.toLowerCase().includes(searchTerm.toLowerCase())) {
+      // Search filter (server-side full-text match)
+      if (searchHits && !searchHits.has(slice.slice_id)) {
         return false;
       }
 
@@ -56,7 +122,7 @@ export function Slices() {
 
       return true;
     });
-  }, [slices, searchTerm, timeRange]);
+  }, [slices, searchHits, timeRange]);
 
   const formatTime = (seconds: number) => {
     const mins = Math.floor(seconds / 60);
@@ -191,7 +257,12 @@ export function Slices() {
           {/* Results Count */}
           <div className="flex items-end">
             <div className="text-sm text-gray-500 dark:text-gray-400">
-              Showing {filteredSlices.length} of {slices.length} slices
+              {searching
+                ? 'Searching...'
+                : `Showing ${filteredSlices.length} of ${slices.length} slices`}
+              {searchError && (
+                <div className="text-red-600 dark:text-red-400">{searchError}</div>
+              )}
             </div>
           </div>
         </div>
@@ -214,6 +285,7 @@ export function Slices() {
           filteredSlices.map((slice) => {
             const isExpanded = expandedSlices.has(slice.slice_id);
             const isRawShown = showRawData === slice.slice_id;
+            const hit = searchHits?.get(slice.slice_id);
             
             return (
               <div 
@@ -271,6 +343,17 @@ export function Slices() {
                   {/* Transcript */}
                   <div className="mb-4">
                     <h4 className="text-sm font-medium text-gray-700 dark:text-gray-300 mb-2">Transcript</h4>
+                    {hit && !isExpanded ? (
+                      <p className="text-gray-900 dark:text-white leading-relaxed">
+                        <span dangerouslySetInnerHTML={{ __html: snippetHtml(hit.snippet) }} />
+                        <button
+                          onClick={() => toggleSliceExpansion(slice.slice_id)}
+                          className="ml-2 text-blue-600 dark:text-blue-400 hover:underline text-sm"
+                        >
+                          Show full
+                        </button>
+                      </p>
+                    ) : (
                     <p className="text-gray-900 dark:text-white leading-relaxed">
                       {isExpanded || slice.transcript.length <= 200 
                         ? slice.transcript 
@@ -285,6 +368,7 @@ export function Slices() {
                         </button>
                       )}
                     </p>
+                    )}
                   </div>
 
                   {/* Expanded Content */}
@@ -328,17 +412,30 @@ export function Slices() {
                         </div>
                       )}
 
-                      {/* Thumbnails Note */}
-                      {slice.thumbnails && slice.thumbnails.length > 0 && (
+                      {/* Thumbnails */}
+                      {slice.thumbnails?.some(isUrl) && (
                         <div>
                           <h4 className="text-sm font-medium text-gray-700 dark:text-gray-300 mb-2">Thumbnails</h4>
-                          <div className="bg-yellow-50 dark:bg-yellow-950 border border-yellow-200 dark:border-yellow-800 p-3 rounded-lg">
-                            <p className="text-sm text-yellow-800 dark:text-yellow-200">
-                              {slice.thumbnails.length} thumbnail(s) available (not publicly accessible)
-                            </p>
+                          <div className="flex flex-wrap gap-2">
+                            {slice.thumbnails.filter(isUrl).map((src) => (
+                              <img
+                                key={src}
+                                src={src}
+                                alt={`Slice at ${slice.t_start}s`}
+                                loading="lazy"
+                                className="h-24 rounded-lg border border-gray-200 dark:border-gray-700"
+                              />
+                            ))}
                           </div>
                         </div>
                       )}
+
+                      {slice.audio_url && (
+                        <div>
+                          <h4 className="text-sm font-medium text-gray-700 dark:text-gray-300 mb-2">Audio</h4>
+                          <audio controls preload="none" src={slice.audio_url} className="w-full" />
+                        </div>
+                      )}
                     </div>
                   )}
 
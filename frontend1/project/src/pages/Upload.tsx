@@ -5,6 +5,7 @@ import { apiClient } from '../api/client';
 import { useJobPolling } from '../hooks/useJobPolling';
 import { FileUpload } from '../components/FileUpload';
 import { ProgressBar } from '../components/ProgressBar';
+import { ScoreBadge } from '../components/ScoreBadge';
 
 type UploadTab = 'file' | 'url';
 
@@ -25,7 +26,7 @@ export function Upload() {
     return stored ? JSON.parse(stored) : [];
   });
 
-  const { jobStatus, error, isPolling } = useJobPolling(currentJobId);
+  const { jobStatus, slices, partial, error, isPolling } = useJobPolling(currentJobId);
 
   const addToHistory = (jobId: string, type: 'file' | 'url', name: string) => {
     const newJob = {
@@ -132,6 +133,20 @@ export function Upload() {
                 />
               )}
 
+              {isPolling && partial && (
+                <div className="mt-4 p-3 bg-gray-50 dark:bg-gray-900 border border-gray-200 dark:border-gray-700 rounded">
+                  <p className="text-xs text-gray-500 dark:text-gray-400 mb-2">
+                    Partial scores from {slices.length} slice{slices.length === 1 ? '' : 's'} so far
+                  </p>
+                  <div className="flex justify-around">
+                    <ScoreBadge score={partial.scores.composite} label="Composite" size="sm" />
+                    <ScoreBadge score={partial.scores.content} label="Content" size="sm" />
+                    <ScoreBadge score={partial.scores.delivery} label="Delivery" size="sm" />
+                    <ScoreBadge score={partial.scores.impact} label="Impact" size="sm" />
+                  </div>
+                </div>
+              )}
+
               {jobStatus?.status === 'SUCCESS' && jobStatus.briefing_id && (
                 <div className="flex items-center justify-between mt-4 p-3 bg-green-50 dark:bg-green-950 border border-green-200 dark:border-green-800 rounded">
                   <div className="flex items-center space-x-2">
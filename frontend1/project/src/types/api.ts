@@ -1,9 +1,33 @@
 export interface JobStatus {
   job_id: string;
-  status: "PENDING" | "PROCESSING" | "SUCCESS" | "FAILURE";
+  status: "PENDING" | "DOWNLOADING" | "PROCESSING" | "SUCCESS" | "FAILURE";
   progress: number;
   error?: string | null;
   briefing_id?: string | null;
+  bytes_downloaded?: number | null;
+  bytes_total?: number | null;
+  // Profiling breakdown: queue_wait_s, wall_s, stages {name: {total_s, count, max_s}}
+  timings?: Record<string, any> | null;
+}
+
+// Per-slice result pushed on /v1/jobs/{id}/events as each slice finishes
+export interface LiveSlice {
+  idx: number;
+  t_start: number;
+  t_end: number;
+  transcript: string;
+  metrics: Record<string, any>;
+  risk_tags: string[];
+  partial?: PartialAggregate | null;
+}
+
+// Running aggregate over the slices finished so far (same shape as a briefing's scores)
+export interface PartialAggregate {
+  duration_s: number;
+  slices: number;
+  scores: BriefingSummary['scores'];
+  highlights: BriefingSummary['highlights'];
+  volatility: BriefingSummary['volatility'];
 }
 
 export interface BriefingSummary {
@@ -29,6 +53,7 @@ export interface BriefingSummary {
     impact: number;
   };
   created_at: string; // ISO
+  source_url?: string | null; // presigned, expires
 }
 
 export interface BriefingListItem {
@@ -38,6 +63,22 @@ export interface BriefingListItem {
   created_at: string;
 }
 
+export interface BriefingListParams {
+  limit?: number;
+  cursor?: string;
+  min_score?: number;
+  max_score?: number;
+  risk_tag?: string[];
+  created_from?: string; // ISO
+  created_to?: string; // ISO
+  search?: string; // substring of id or video source
+}
+
+export interface BriefingPage {
+  items: BriefingListItem[];
+  nextCursor: string | null; // from the X-Next-Cursor header
+}
+
 export interface SliceRow {
   slice_id: string;
   t_start: number;
@@ -45,8 +86,23 @@ export interface SliceRow {
   transcript: string;
   metrics: Record<string, any>;
   risk_tags: string[];
-  thumbnails: string[];
+  thumbnails: string[]; // presigned URLs
   au: Record<string, number>;
+  audio_url?: string | null;
+}
+
+export interface SearchHit {
+  briefing_id: string;
+  slice_id: string;
+  t_start: number;
+  t_end: number;
+  rank: number;
+  snippet: string; // matched terms wrapped in <mark>
+}
+
+export interface SearchResults {
+  hits: SearchHit[];
+  next_offset?: number | null;
 }
 
 export interface HealthResponse {